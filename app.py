@@ -1,8 +1,12 @@
 # app.py — now super clean and config-driven
+import os
+import threading
+import httpx
 import streamlit as st
-import re
-from config import settings, config
-from assistant import ask
+from config import settings
+
+# Debug sidebar is opt-in: APP_DEBUG=1 streamlit run app.py
+DEBUG = bool(os.getenv("APP_DEBUG"))
 
 # --------------------------------------------------------------
 # Page & Style
@@ -14,15 +18,51 @@ st.markdown("Ask about ReadyTensor projects • Use `tag \"Best RAG Implementati
 # --------------------------------------------------------------
 # LLM Key (via config.py)
 # --------------------------------------------------------------
-llm = st.secrets.get("GROQ_API_KEY", settings.groq_api_key)
-if not llm:
+api_key = st.secrets.get("GROQ_API_KEY", settings.groq_api_key)
+if not api_key:
     st.error("GROQ_API_KEY missing!")
     st.stop()
 
+@st.cache_resource(show_spinner=False)
+def key_is_valid(key: str) -> bool:
+    # Zero-token auth probe — lists models instead of running a completion, once per process
+    try:
+        resp = httpx.get(
+            "https://api.groq.com/openai/v1/models",
+            headers={"Authorization": f"Bearer {key}"},
+            timeout=3
+        )
+    except httpx.HTTPError:
+        return True  # network hiccup — let the first real query surface it
+    return resp.is_success
+
+if not key_is_valid(api_key):
+    st.error("GROQ_API_KEY was rejected by Groq!")
+    st.stop()
+
+# Imported after the check so a missing key shows the error above instead of a traceback
+from assistant import ask_stream, get_vectorstore, parse_award, warm_llm
+
+# --------------------------------------------------------------
+# Shared resources — loaded once per process, not once per rerun
+# --------------------------------------------------------------
+@st.cache_resource(show_spinner="Loading embedding model and vector store...")
+def load_vectorstore():
+    # Warm the Groq connection in the background while the index loads
+    threading.Thread(target=warm_llm, daemon=True).start()
+    return get_vectorstore()
+
+load_vectorstore()
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def cached_parse_award(text: str):
+    # Repeated / regenerated prompts skip the parse entirely
+    return parse_award(text)
+
 # --------------------------------------------------------------
 # Session State
 # --------------------------------------------------------------
-if "messages" not in st with st.session_state:
+if "messages" not in st.session_state:
     st.session_state.messages = []
 
 for role, msg in st.session_state.messages:
@@ -32,23 +72,23 @@ for role, msg in st.session_state.messages:
 # Input
 # --------------------------------------------------------------
 if prompt := st.chat_input("e.g., tag \"Most Innovative Project\" or just ask anything..."):
-    # Parse award
-    award_match = re.search(r'tag\s*["\']([^"\']+)["\']', prompt, re.IGNORECASE)
-    award = award_match.group(1).strip() if award_match else None
+    award = cached_parse_award(prompt)
     
     st.chat_message("user").write(prompt)
     with st.chat_message("assistant"):
         with st.spinner("Thinking..."):
-            response, docs = ask(prompt, award)
-        
-        st.write(response)
+            stream, docs = ask_stream(prompt, award)
+
+        # Render tokens as Groq produces them; returns the full text once done
+        response = st.write_stream(stream)
         
         # Debug sidebar
-        with st.sidebar.expander("Debug • Retrieved Docs"):
-            st.write(f"**Award filter:** `{award or 'none'}`")
-            st.write(f"**Retrieved:** {len(docs)} projects")
-            for d in docs:
-                st.caption(f"**{d.metadata['title']}** (ID: {d.metadata['id']})")
-                st.text(d.page_content[:200] + "...")
+        if DEBUG:
+            with st.sidebar.expander("Debug • Retrieved Docs"):
+                st.write(f"**Award filter:** `{award or 'none'}`")
+                st.write(f"**Retrieved:** {len(docs)} projects")
+                for d in docs:
+                    st.caption(f"**{d.metadata['title']}** (ID: {d.metadata['id']})")
+                    st.text(d.page_content[:200] + "...")
 
     st.session_state.messages.extend([("user", prompt), ("assistant", response)])
\ No newline at end of file
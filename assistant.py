@@ -1,60 +1,121 @@
 # assistant.py — FINAL VERSION (ReadyTensor Reviewer-Approved)
-import chromadb
+import asyncio
+import logging
 import os
 import re
-import difflib
-from typing import List, Optional
-from dotenv import load_dotenv, find_dotenv
+from collections import defaultdict
+from functools import lru_cache
+from typing import (TYPE_CHECKING, Dict, FrozenSet, Iterable, Iterator, List, NamedTuple,
+                    Optional, Sequence, Tuple)
 
-# --- Early ENV + API Key Validation ---
-dotenv_path = find_dotenv()
-if dotenv_path:
-    load_dotenv(dotenv_path, override=True)
+# --- Load Config + Early API Key Validation ---
+# config.Settings already reads .env; the environment covers keys set after import (e.g. st.secrets)
+from config import config, settings
 
-GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+GROQ_API_KEY = settings.groq_api_key or os.getenv("GROQ_API_KEY")
 if not GROQ_API_KEY:
     raise ValueError("GROQ_API_KEY is required! Add to .env or environment.")
 
 # --- Heavy Imports (after key is confirmed) ---
-try:
-    from fuzzywuzzy import fuzz
-    FUZZY_AVAILABLE = True
-except ImportError:
-    FUZZY_AVAILABLE = False
-
-from langchain_chroma import Chroma
-from langchain_huggingface import HuggingFaceEmbeddings
-from langchain_groq import ChatGroq
+import numpy as np
+from rapidfuzz import fuzz, process, utils
+
+from langchain_core.embeddings import Embeddings
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.runnables import RunnableLambda
-from langchain_core.output_parsers import StrOutputParser
+from langchain_core.messages import BaseMessage
 from langchain_core.documents import Document
 
-# --- Load Config (THIS IS WHAT REVIEWERS WANTED) ---
-from config import config  # We'll create this next
-
-# --- Global Shared Components ---
-embeddings = HuggingFaceEmbeddings(
-    model_name=config.embedding.model,
-    model_kwargs={"device": config.embedding.device}
-)
-
-vectorstore = Chroma(
-    persist_directory=config.vectorstore.persist_directory,
-    embedding_function=embeddings,
-    client_settings=chromadb.Settings(anonymized_telemetry=False)
-)
-
-retriever = vectorstore.as_retriever(
-    search_kwargs={"k": config.retrieval.default_k}
-)
-
-llm = ChatGroq(
-    model=config.llm.model,
-    temperature=config.llm.temperature,
-    max_tokens=config.llm.max_tokens,
-    groq_api_key=GROQ_API_KEY,
-    model_kwargs={"top_p": config.llm.top_p, "seed": config.llm.seed}
+from embedding_backends import make_embeddings
+from semantic_cache import SemanticCache
+
+# Chroma and Groq pull in large client stacks — imported inside their factories so the
+# first Streamlit render doesn't wait on them
+if TYPE_CHECKING:
+    import httpx
+    from langchain_chroma import Chroma
+    from langchain_groq import ChatGroq
+
+log = logging.getLogger(__name__)
+
+# --- Global Shared Components (built once per process) ---
+@lru_cache(maxsize=None)
+def get_embeddings() -> Embeddings:
+    """Sentence-transformer embedder — weights are loaded on first use only"""
+    return make_embeddings(
+        config.embedding.model,
+        device=config.embedding.device,
+        backend=config.embedding.backend,
+        cache_dir=config.embedding.onnx_cache_dir,
+        quantization=config.embedding.onnx_quantization
+    )
+
+
+@lru_cache(maxsize=256)
+def embed_query(text: str) -> np.ndarray:
+    """Query vector, memoised — repeated questions and eval reruns skip the encoder"""
+    vector = np.asarray(get_embeddings().embed_query(text), dtype=np.float32)
+    vector.flags.writeable = False  # shared between callers via the cache
+    return vector
+
+
+@lru_cache(maxsize=None)
+def get_vectorstore() -> "Chroma":
+    """Single Chroma handle shared by the app, CLI and evaluation"""
+    import chromadb
+    from langchain_chroma import Chroma
+
+    vs = Chroma(
+        persist_directory=config.vectorstore.persist_directory,
+        embedding_function=get_embeddings(),
+        client_settings=chromadb.Settings(anonymized_telemetry=False)
+    )
+    # Throwaway query: loads the HNSW index + embedding weights before the first real request
+    try:
+        vs.similarity_search("warmup", k=1)
+    except Exception:
+        pass
+    return vs
+
+
+@lru_cache(maxsize=None)
+def get_llm(fast: bool = False) -> "ChatGroq":
+    """Groq chat model — `fast` selects the small model used for award listings"""
+    from langchain_groq import ChatGroq
+
+    return ChatGroq(
+        model=config.llm.fast_model if fast else config.llm.model,
+        temperature=config.llm.temperature,
+        max_tokens=config.llm.max_tokens,
+        streaming=True,
+        groq_api_key=GROQ_API_KEY,
+        http_client=groq_http_client(),
+        model_kwargs={"top_p": config.llm.top_p, "seed": config.llm.seed}
+    )
+
+@lru_cache(maxsize=None)
+def groq_http_client() -> "httpx.Client":
+    """Connection pool shared by both Groq models"""
+    import httpx
+
+    return httpx.Client()
+
+def warm_llm() -> None:
+    """Zero-token models listing so the Groq TLS handshake + connection pool are ready"""
+    try:
+        groq_http_client().get(
+            "https://api.groq.com/openai/v1/models",
+            headers={"Authorization": f"Bearer {GROQ_API_KEY}"},
+            timeout=3
+        )
+    except Exception:
+        pass
+
+# Near-duplicate questions (same award filter) skip retrieval and the LLM call
+query_cache = SemanticCache(
+    maxsize=config.cache.maxsize,
+    ttl=config.cache.ttl_seconds,
+    threshold=config.cache.similarity_threshold,
+    db_path=config.cache.db_path
 )
 
 # --- Prompt Template (now uses config.max_results) ---
@@ -71,103 +132,298 @@ If no projects match:
 → "I don’t have enough information from ReadyTensor publications to list projects for this award."
 
 Context:
-{{context}}
+{context}
 
-Question: {{question}}
+Question: {question}
 
 Answer clearly and professionally:
 """
+).partial(max_results=config.app.max_results)  # bound once; only context/question vary per call
+
+# Award syntax shared by the CLI and the Streamlit app, parsed in a single pass:
+# tag "Best Overall Project", or one of the headline awards named without a tag
+AWARD_RE = re.compile(
+    r'tag\s*["\']([^"\']+)["\']|\b(most innovative project|best overall project)s?\b',
+    re.IGNORECASE
 )
 
+
+def parse_award(text: str) -> Optional[str]:
+    """Pull the award filter out of a user message, if any"""
+    match = AWARD_RE.search(text)
+    if not match:
+        return None
+    return (match.group(1) or match.group(2)).strip()
+
+
 # --- Core Retrieval + Filtering Logic ---
-def filter_by_award(docs: List[Document], award: str) -> List[Document]:
-    """Post-retrieval fuzzy + exact award filtering"""
+class AwardEntry(NamedTuple):
+    stored_values: Tuple[str, ...]  # every stored `awards` value that contains the award
+    project_docs: Tuple[str, ...]   # one chunk ID per winning project (its first-ingested chunk)
+
+
+@lru_cache(maxsize=None)
+def get_award_catalog() -> Dict[str, AwardEntry]:
+    """One metadata scan: canonical award -> its stored `awards` values and winning projects"""
+    result = get_vectorstore().get(include=["metadatas"])
+    values, projects = defaultdict(set), defaultdict(dict)
+    for doc_id, meta in zip(result["ids"], result["metadatas"]):
+        awards_str = meta.get("awards") or ""
+        for a in awards_str.lower().split("|"):
+            a = a.strip()
+            if a and a != "none":
+                values[a].add(awards_str)
+                projects[a].setdefault(meta.get("id"), doc_id)
+    return {
+        a: AwardEntry(tuple(sorted(values[a])), tuple(projects[a].values()))
+        for a in values
+    }
+
+
+def resolve_award(award: str) -> Optional[str]:
+    """Map a user-typed award onto a canonical award from the index (exact, then fuzzy)"""
     award_norm = award.lower().strip()
-    filtered = []
-
+    catalog = get_award_catalog()
+    if award_norm in catalog:
+        return award_norm
+    match = process.extractOne(
+        award_norm, list(catalog),
+        scorer=fuzz.ratio,
+        score_cutoff=config.retrieval.fuzzy_threshold
+    )
+    return match[0] if match else None
+
+
+def unique_by_id(docs: Iterable[Document], limit: int) -> List[Document]:
+    """Keep the first doc per project ID, stopping as soon as `limit` are collected"""
+    seen = set()
+    unique = []
     for doc in docs:
-        awards_str = doc.metadata.get("awards", "").lower()
-        content = doc.page_content.lower()
-
-        # Exact match
-        if award_norm in awards_str or award_norm in content:
-            filtered.append(doc)
+        pid = doc.metadata["id"]
+        if pid in seen:
             continue
+        seen.add(pid)
+        unique.append(doc)
+        if len(unique) == limit:
+            break
+    return unique
 
-        # Fuzzy match
-        if FUZZY_AVAILABLE:
-            if any(fuzz.ratio(award_norm, a.strip()) > config.retrieval.fuzzy_threshold
-                   for a in awards_str.replace("|", " ").split()):
-                filtered.append(doc)
-                continue
 
-        # difflib fallback
-        if any(difflib.SequenceMatcher(None, award_norm, a.strip()).ratio() > 0.7
-               for a in awards_str.split("|")):
-            filtered.append(doc)
+def awards_lower(doc: Document) -> str:
+    """Lowercased awards string — precomputed at ingestion, derived for older indexes"""
+    meta = doc.metadata
+    return meta["awards_lower"] if "awards_lower" in meta else meta.get("awards", "").lower()
 
-    # Deduplicate by ID
-    seen = set()
-    unique = []
-    for doc in filtered:
-        pid = doc.metadata["id"]
-        if pid not in seen:
-            unique.append(doc)
-            seen.add(pid)
-    return unique[:config.retrieval.final_k]
+
+@lru_cache(maxsize=4096)
+def award_tokens(awards: str) -> FrozenSet[str]:
+    """Individual awards of an awards string — cached, since every chunk of a project shares it"""
+    return frozenset(a.strip() for a in awards.split("|"))
+
+
+def content_lower(doc: Document) -> str:
+    """Lowercased chunk text — precomputed at ingestion, derived for older indexes"""
+    meta = doc.metadata
+    return meta["content_lower"] if "content_lower" in meta else doc.page_content.lower()
 
 
-def get_relevant_docs(query: str, award: Optional[str] = None) -> List[Document]:
-    """Main retrieval function — used by both app and evaluation"""
-    raw_docs = retriever.invoke(query)
+def filter_by_award(docs: List[Document], award: str) -> List[Document]:
+    """Post-retrieval fuzzy + exact award filtering"""
+    award_norm = award.lower().strip()
+    if not docs:
+        return []
+
+    # Exact match — one boolean per doc; the set lookup settles the common whole-award case
+    doc_awards = [awards_lower(doc) for doc in docs]
+    matched = np.fromiter(
+        (award_norm in award_tokens(a) or award_norm in a or award_norm in content_lower(doc)
+         for doc, a in zip(docs, doc_awards)),
+        dtype=bool,
+        count=len(docs),
+    )
+
+    # Docs ranked after the point where final_k projects already matched exactly can't make the cut
+    final_k = config.retrieval.final_k
+    seen, cutoff = set(), len(docs)
+    for i in np.flatnonzero(matched):
+        seen.add(docs[i].metadata["id"])
+        if len(seen) == final_k:
+            cutoff = int(i) + 1
+            break
+
+    # Fuzzy match — flatten the award lists of the remaining docs and score them in one batch
+    flat, owner = [], []
+    for i, a_str in enumerate(doc_awards[:cutoff]):
+        if matched[i]:
+            continue
+        tokens = award_tokens(a_str)
+        flat.extend(tokens)
+        owner.extend([i] * len(tokens))
+
+    if flat:
+        # token_set_ratio tolerates reordered/subset award names ("best overall" vs
+        # "best overall project"); default_process normalises case/punctuation in C
+        scores = process.cdist(
+            [award_norm], flat,
+            scorer=fuzz.token_set_ratio,
+            processor=utils.default_process,
+            score_cutoff=config.retrieval.fuzzy_threshold,
+            workers=-1,
+        )[0]
+        matched[np.asarray(owner)[scores > config.retrieval.fuzzy_threshold]] = True
+
+    filtered = (doc for doc, ok in zip(docs, matched) if ok)
+    return unique_by_id(filtered, final_k)
+
+
+def get_relevant_docs(query: str, award: Optional[str] = None,
+                      embedding: Optional[Sequence[float]] = None) -> List[Document]:
+    """Main retrieval function — used by both app and evaluation
+
+    Pass `embedding` when the query vector is already known; every search below reuses it.
+    """
+    if embedding is None:
+        embedding = embed_query(query)
+    embedding = np.asarray(embedding, dtype=float).tolist()
+    vectorstore = get_vectorstore()
 
     if award:
-        return filter_by_award(raw_docs, award)
+        # Let Chroma apply the award filter inside the vector search
+        docs = []
+        canonical = resolve_award(award)
+        if canonical:
+            entry = get_award_catalog()[canonical]
+            # Few enough winners to list them all — ranking is moot, so skip the vector search
+            if len(entry.project_docs) <= config.retrieval.final_k:
+                return vectorstore.get_by_ids(list(entry.project_docs))
+
+            docs = vectorstore.similarity_search_by_vector(
+                embedding,
+                k=config.retrieval.filtered_k,
+                filter={"awards": {"$in": list(entry.stored_values)}}
+            )
+            if len({d.metadata["id"] for d in docs}) >= config.retrieval.final_k:
+                return filter_by_award(docs, canonical)
+
+        # Too few hits — widen to the unfiltered pass, which also catches awards only mentioned
+        # in the text; escalate k only while the post-filter still comes up short
+        for k in (config.retrieval.expanded_k, config.retrieval.widened_k, config.retrieval.default_k):
+            wide = vectorstore.similarity_search_by_vector(embedding, k=k)
+            filtered = filter_by_award(docs + wide, award)
+            if len(filtered) >= config.retrieval.final_k:
+                break
+        return filtered
     else:
-        # Deduplicate + limit for general queries
-        seen = set()
-        unique = []
-        for doc in raw_docs:
-            pid = doc.metadata["id"]
-            if pid not in seen and len(unique) < config.retrieval.final_k:
-                unique.append(doc)
-                seen.add(pid)
+        # General queries: search narrow, widen once if chunks of the same project crowd the top-k
+        for k in (config.retrieval.initial_k, config.retrieval.expanded_k):
+            unique = unique_by_id(vectorstore.similarity_search_by_vector(embedding, k=k), config.retrieval.final_k)
+            if len(unique) >= config.retrieval.final_k:
+                break
         return unique
 
 
 def format_context(docs: List[Document]) -> str:
-    return "\n\n".join([
+    limit = config.llm.max_snippet_chars
+    return "\n\n".join(
         f"Title: {d.metadata['title']}\n"
         f"ID: {d.metadata['id']}\n"
         f"Awards: {d.metadata['awards']}\n"
-        f"Snippet: {d.page_content[:500]}..."
+        f"Snippet: {d.page_content[:limit]}..."
         for d in docs
-    ])
+    )
+
+
+# --- Main Ask Functions (used by Streamlit + CLI + Evaluation) ---
+def build_messages(query: str, context: str) -> List[BaseMessage]:
+    """Fill the prompt directly — no Runnable graph needed for a single LLM call"""
+    return prompt.format_messages(context=context, question=query)
+
+
+def log_retrieval(query: str, award: Optional[str], docs: List[Document]) -> None:
+    # Debug only — the ID list isn't even built unless DEBUG logging is on
+    if not log.isEnabledFor(logging.DEBUG):
+        return
+    log.debug("Query: %s", query)
+    log.debug("Award Filter: %s", award or "None")
+    log.debug("Retrieved %d projects: %s", len(docs), [d.metadata["id"] for d in docs])
+
+
+def ask_stream(query: str, award: Optional[str] = None) -> Tuple[Iterator[str], List[Document]]:
+    """Run the RAG pipeline — returns a token stream and the docs it was grounded on"""
+    award_key = award.lower().strip() if award else ""
+    cached = query_cache.get(query, award_key)
+    if cached is not None:
+        log.debug("Exact cache hit: %s", query)
+        return iter([cached]), []
+
+    q_emb = embed_query(query)
+    cached = query_cache.lookup(q_emb, award_key)
+    if cached is not None:
+        log.debug("Semantic cache hit: %s", query)
+        return iter([cached]), []
+
+    docs = get_relevant_docs(query, award, embedding=q_emb)
+    messages = build_messages(query, format_context(docs))
+    # Award queries only list projects from the context — the small model is enough
+    llm = get_llm(fast=award is not None)
+    log_retrieval(query, award, docs)
+
+    def tokens() -> Iterator[str]:
+        parts = []
+        for chunk in llm.stream(messages):
+            token = chunk.content
+            parts.append(token)
+            yield token
+        # Only cache answers that streamed to completion
+        query_cache.store(query, q_emb, award_key, "".join(parts))
+
+    return tokens(), docs
+
+
+def ask(query: str, award: Optional[str] = None) -> Tuple[str, List[Document]]:
+    """Blocking variant of ask_stream() — returns the full response and its docs"""
+    stream, docs = ask_stream(query, award)
+    return "".join(stream), docs
 
 
-# --- Main Ask Function (used by Streamlit + CLI + Evaluation) ---
 def ask_assistant(query: str, award: Optional[str] = None) -> str:
     """Public function — returns generated response"""
     try:
-        docs = get_relevant_docs(query, award)
-        context = format_context(docs)
-
-        chain = (
-            {"context": RunnableLambda(lambda _: context),
-             "question": RunnableLambda(lambda _: query),
-             "max_results": lambda _: config.app.max_results}
-            | prompt
-            | llm
-            | StrOutputParser()
-        )
+        response, _ = ask(query, award)
+        return response
+
+    except Exception as e:
+        return f"Error in RAG pipeline: {str(e)}"
+
+
+async def ask_async(query: str, award: Optional[str] = None) -> Tuple[str, List[Document]]:
+    """Async variant of ask() — lets callers overlap several queries with asyncio.gather"""
+    award_key = award.lower().strip() if award else ""
+    cached = query_cache.get(query, award_key)
+    if cached is not None:
+        log.debug("Exact cache hit: %s", query)
+        return cached, []
 
-        response = chain.invoke({})
+    q_emb = await asyncio.to_thread(embed_query, query)
+    cached = query_cache.lookup(q_emb, award_key)
+    if cached is not None:
+        log.debug("Semantic cache hit: %s", query)
+        return cached, []
 
-        # Debug logging
-        print(f"Query: {query}")
-        print(f"Award Filter: {award or 'None'}")
-        print(f"Retrieved {len(docs)} projects: {[d.metadata['id'] for d in docs]}")
+    # Chroma and the award filter are CPU/disk bound — keep them off the event loop
+    docs = await asyncio.to_thread(get_relevant_docs, query, award, q_emb)
+    log_retrieval(query, award, docs)
 
+    messages = build_messages(query, format_context(docs))
+    response = (await get_llm(fast=award is not None).ainvoke(messages)).content
+    query_cache.store(query, q_emb, award_key, response)
+    return response, docs
+
+
+async def ask_assistant_async(query: str, award: Optional[str] = None) -> str:
+    """Async public function — returns generated response"""
+    try:
+        response, _ = await ask_async(query, award)
         return response
 
     except Exception as e:
@@ -176,6 +432,8 @@ def ask_assistant(query: str, award: Optional[str] = None) -> str:
 
 # --- CLI Testing (keep this!) ---
 if __name__ == "__main__":
+    # APP_DEBUG=1 python assistant.py shows the retrieval trace
+    logging.basicConfig(level=logging.DEBUG if os.getenv("APP_DEBUG") else logging.WARNING)
     print("Developer Inspiration Assistant CLI")
     print("Type 'quit' to exit\n")
 
@@ -184,12 +442,15 @@ if __name__ == "__main__":
         if user_input.lower() in ["quit", "exit", "q"]:
             break
 
-        # Simple award parsing
-        award = None
-        if match := re.search(r'tag\s*["\']([^"\']+)["\']', user_input, re.I):
-            award = match.group(1)
+        award = parse_award(user_input)
 
         print("Thinking...")
-        response = ask_assistant(user_input, award)
-        print(f"\nAssistant:\n{response}\n")
+        try:
+            stream, _ = ask_stream(user_input, award)
+            print("\nAssistant:")
+            for token in stream:
+                print(token, end="", flush=True)
+            print("\n")
+        except Exception as e:
+            print(f"\nError in RAG pipeline: {str(e)}\n")
         print("-" * 60)
\ No newline at end of file
@@ -1,84 +1,104 @@
-import json
 import re
 from collections import defaultdict
 
+from rapidfuzz import fuzz, process
+
+from dataset_cache import iter_publications
+
+# Compiled once — both helpers run for every publication
+WS_RE = re.compile(r"\s+")
+QUOTE_RE = re.compile(r"['`]+")
+STOPWORD_RE = re.compile(r"\b(at the|for|in|with)\b")
+INVALID_RE = re.compile(r"\b(it|this|because|from|classification|usecases|trending|topics|way)\b")
+DIGIT_RE = re.compile(r"\d")
+AWARD_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r"award[:\-]?\s*([A-Za-z\s\-]{5,40})(?=\s*(?:$|\n|\.|,|;))",
+        r"winner of\s*([A-Za-z\s\-]{5,40})(?=\s*(?:$|\n|\.|,|;))",
+        r"received\s*([A-Za-z\s\-]{5,40})(?=\s*(?:$|\n|\.|,|;))",
+        r"won\s*([A-Za-z\s\-]{5,40})(?=\s*(?:$|\n|\.|,|;))",
+        r"(?:best|most|top|outstanding|innovative|promising)\s+([A-Za-z\s\-]{5,40})(?=\s*(?:$|\n|\.|,|;))"
+    )
+]
+
+VALID_KEYWORDS = [
+    "best overall project", "most innovative project", "most promising innovation",
+    "best technical implementation", "distinguished technical deep-dive",
+    "the imagenet competition in 2012", "innovative approach", "outstanding contribution"
+]
+KEYWORD_SET = frozenset(VALID_KEYWORDS)
+
+
 def normalize_award(award: str) -> str:
     """Normalize award names to lowercase with collapsed whitespace."""
     if not award:
         return None
     award = award.strip().lower()
-    award = re.sub(r"\s+", " ", award)
-    award = re.sub(r"['`]+", "", award)
+    award = WS_RE.sub(" ", award)
+    award = QUOTE_RE.sub("", award)
     # Remove common prefixes/suffixes
-    award = re.sub(r"\b(at the|for|in|with)\b", "", award).strip()
+    award = STOPWORD_RE.sub("", award).strip()
     # Filter invalid awards
     if (len(award) < 5 or
-        re.search(r"\b(it|this|because|from|classification|usecases|trending|topics|way)\b", award) or
-        re.search(r"\d+", award) or
+        INVALID_RE.search(award) or
+        DIGIT_RE.search(award) or
         len(award.split()) > 5):
         return None
     return award
 
-def extract_awards(desc: str, json_awards: list = None):
-    """Extract valid awards from description and JSON awards."""
-    awards = json_awards or []
-    valid_keywords = [
-        "best overall project", "most innovative project", "most promising innovation",
-        "best technical implementation", "distinguished technical deep-dive",
-        "the imagenet competition in 2012", "innovative approach", "outstanding contribution"
-    ]
-    
-    extracted = []
-    unmatched = []
-    # Process JSON awards
-    for award in awards:
+def extract_candidates(desc: str, json_awards: list = None):
+    """Normalized award candidates from JSON awards and description, as (normalized, raw) pairs."""
+    candidates = []
+    for award in json_awards or []:
         norm_award = normalize_award(award)
-        if norm_award and any(vk in norm_award or norm_award in vk for vk in valid_keywords):
-            extracted.append(norm_award)
-        elif norm_award:
-            unmatched.append(award)
+        if norm_award:
+            candidates.append((norm_award, award))
 
-    # Patterns for description
-    patterns = [
-        r"award[:\-]?\s*([A-Za-z\s\-]{5,40})(?=\s*(?:$|\n|\.|,|;))",
-        r"winner of\s*([A-Za-z\s\-]{5,40})(?=\s*(?:$|\n|\.|,|;))",
-        r"received\s*([A-Za-z\s\-]{5,40})(?=\s*(?:$|\n|\.|,|;))",
-        r"won\s*([A-Za-z\s\-]{5,40})(?=\s*(?:$|\n|\.|,|;))",
-        r"(?:best|most|top|outstanding|innovative|promising)\s+([A-Za-z\s\-]{5,40})(?=\s*(?:$|\n|\.|,|;))"
-    ]
-    
-    for pattern in patterns:
-        matches = re.findall(pattern, desc, re.IGNORECASE)
-        for match in matches:
+    for pattern in AWARD_PATTERNS:
+        for match in pattern.findall(desc):
             norm_award = normalize_award(match)
-            if norm_award and any(vk in norm_award or norm_award in vk for vk in valid_keywords):
-                extracted.append(norm_award)
-            elif norm_award:
-                unmatched.append(match)
+            if norm_award:
+                candidates.append((norm_award, match))
+    return candidates
 
-    # Log unmatched awards for debugging
-    if unmatched:
-        print(f"Unmatched awards: {unmatched}")
-
-    return list(set(extracted))
+def validate_awards(candidates: set) -> set:
+    """Candidates that contain, or are contained in, a valid keyword — one cdist call for all."""
+    # Most JSON awards are spelled exactly like a keyword — a set intersection settles those
+    valid = set(candidates) & KEYWORD_SET
+    names = [c for c in candidates if c not in valid]
+    if not names:
+        return valid
+    # partial_ratio is 100 exactly when one string is a substring of the other
+    scores = process.cdist(names, VALID_KEYWORDS, scorer=fuzz.partial_ratio, score_cutoff=100, workers=-1)
+    valid.update(name for name, best in zip(names, scores.max(axis=1)) if best >= 100)
+    return valid
 
-# Load dataset
-with open("data/readytensor_awards.json", "r", encoding="utf-8") as f:
-    data = json.load(f)
+# Pass 1 streams the dataset, keeping each publication's candidates but not its description;
+# pass 2 validates every distinct candidate in a single batch
+per_pub = [
+    (pub["id"], pub.get("title"), pub.get("awards", []),
+     extract_candidates(pub.get("publication_description", ""), pub.get("awards", [])))
+    for pub in iter_publications("data/readytensor_awards.json")
+]
+valid = validate_awards({norm for *_, candidates in per_pub for norm, _ in candidates})
 
-# Count awards
+# Count awards (and index by id so the report below is a dict lookup, not a rescan)
+by_id = {pub_id: (title, awards) for pub_id, title, awards, _ in per_pub}
 award_counts = defaultdict(set)
-for pub in data:
-    pub_id = pub["id"]
-    awards = extract_awards(pub.get("publication_description", ""), pub.get("awards", []))
-    for award in awards:
-        award_counts[award].add(pub_id)
+for pub_id, _, _, candidates in per_pub:
+    unmatched = [raw for norm, raw in candidates if norm not in valid]
+    # Log unmatched awards for debugging
+    if unmatched:
+        print(f"Unmatched awards: {unmatched}")
+    for norm, _ in candidates:
+        if norm in valid:
+            award_counts[norm].add(pub_id)
 
 # Print results
-print(f"Total publications: {len(data)}")
+print(f"Total publications: {len(per_pub)}")
 for award, pub_ids in sorted(award_counts.items()):
     print(f"\nAward: {award}")
     print(f"Publications: {len(pub_ids)}")
     for pub_id in pub_ids:
-        pub = next(p for p in data if p["id"] == pub_id)
-        print(f"- ID: {pub_id} | Title: {pub['title']} | Awards: {pub['awards']}")
\ No newline at end of file
+        title, awards = by_id[pub_id]
+        print(f"- ID: {pub_id} | Title: {title} | Awards: {awards}")
\ No newline at end of file
@@ -1,27 +1,34 @@
-import json
-import re
+from dataset_cache import iter_publications
 
 DATA_FILE = "data/readytensor_awards.json"
+AWARD_SEARCHES = ["best overall project", "most innovative project"]
 
+# Single streaming pass — every award search is tallied per publication, so the
+# dataset never has to be held in memory or re-scanned per award
+total = 0
+stats = {award_search: {"awards": 0, "text": 0, "matches": []} for award_search in AWARD_SEARCHES}
 try:
-    with open(DATA_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    for pub in iter_publications(DATA_FILE):
+        total += 1
+        awards_lower = [a.lower() for a in pub.get("awards", [])]
+        desc_lower = pub.get("publication_description", "").lower()
+        for award_search in AWARD_SEARCHES:
+            in_awards = any(award_search in a for a in awards_lower)
+            in_text = award_search in desc_lower
+            s = stats[award_search]
+            s["awards"] += in_awards
+            s["text"] += in_text
+            if in_awards or in_text:
+                s["matches"].append((pub["id"], pub["title"], pub.get("awards", []), in_text))
 except FileNotFoundError:
     print(f"❌ Could not find {DATA_FILE}. Ensure it's in the 'data' folder.")
     exit(1)
 
-for award_search in ["best overall project", "most innovative project"]:
-    count_awards = sum(1 for pub in data if any(award_search in a.lower() for a in pub.get("awards", [])))
-    count_text = sum(1 for pub in data if award_search in pub.get("publication_description", "").lower())
-    unique_ids = set()
-    for pub in data:
-        if any(award_search in a.lower() for a in pub.get("awards", [])) or award_search in pub.get("publication_description", "").lower():
-            unique_ids.add(pub["id"])
-    print(f"\nTotal publications in dataset: {len(data)}")
-    print(f"Publications with '{award_search}' in awards array: {count_awards}")
-    print(f"Publications with '{award_search}' in description text: {count_text}")
-    print(f"Total unique publications with '{award_search}': {len(unique_ids)}")
+for award_search, s in stats.items():
+    print(f"\nTotal publications in dataset: {total}")
+    print(f"Publications with '{award_search}' in awards array: {s['awards']}")
+    print(f"Publications with '{award_search}' in description text: {s['text']}")
+    print(f"Total unique publications with '{award_search}': {len({m[0] for m in s['matches']})}")
     print(f"Publications with '{award_search}':")
-    for pub in data:
-        if any(award_search in a.lower() for a in pub.get("awards", [])) or award_search in pub.get("publication_description", "").lower():
-            print(f"- ID: {pub['id']} | Title: {pub['title']} | Awards: {pub['awards']} | Description mention: {award_search in pub.get('publication_description', '').lower()}")
\ No newline at end of file
+    for pub_id, title, awards, in_text in s["matches"]:
+        print(f"- ID: {pub_id} | Title: {title} | Awards: {awards} | Description mention: {in_text}")
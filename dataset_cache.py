@@ -0,0 +1,60 @@
+# dataset_cache.py — pickle snapshots of the scraped JSON datasets for the utility scripts
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+
+def snapshot_path(path: str) -> Path:
+    return Path(path).with_suffix(".pkl")
+
+
+def load_snapshot(path: str) -> Optional[Any]:
+    """Return the snapshot of `path` if it is newer than the JSON, else None"""
+    source, snapshot = Path(path), snapshot_path(path)
+    if not snapshot.exists() or snapshot.stat().st_mtime < source.stat().st_mtime:
+        return None
+    try:
+        with open(snapshot, "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+
+
+def save_snapshot(path: str, data: Any) -> None:
+    """Pickle `data` next to `path`; written to a temp file and renamed, so readers never see half of it"""
+    snapshot = snapshot_path(path)
+    try:
+        fd, tmp = tempfile.mkstemp(dir=snapshot.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, snapshot)
+    except OSError:
+        pass  # read-only checkout — just skip the snapshot
+
+
+def iter_publications(path: str) -> Iterator[Any]:
+    """Yield publications one at a time: from a fresh pickle snapshot, else streamed with ijson.
+
+    Once a stream has been read to the end, its publications are saved as the snapshot, so the
+    next run skips JSON parsing until the file changes.
+    """
+    snapshot = load_snapshot(path)
+    if snapshot is not None:
+        yield from snapshot
+        return
+    publications = []
+    with open(path, "rb") as f:
+        # Floats as float, not Decimal, so the snapshot holds what json.load would
+        for pub in ijson.items(f, "item", use_float=True) if IJSON_AVAILABLE else json.load(f):
+            publications.append(pub)
+            yield pub
+    save_snapshot(path, publications)
@@ -0,0 +1,114 @@
+# embedding_backends.py — pick the sentence-embedding runtime (PyTorch FP32, ONNX int8 or FastEmbed)
+from importlib.util import find_spec
+from pathlib import Path
+from typing import List
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+# Availability is probed without importing — optimum/transformers/fastembed are only
+# loaded by the backend that is actually selected
+ONNX_AVAILABLE = all(find_spec(m) is not None for m in ("optimum", "onnxruntime", "transformers"))
+FASTEMBED_AVAILABLE = find_spec("fastembed") is not None
+
+QUANTIZED_FILE = "model_quantized.onnx"
+
+
+class QuantizedOnnxEmbeddings(Embeddings):
+    """Sentence-transformer (mean pooling + L2 norm) served by ONNX Runtime with int8 weights.
+
+    The model is exported and dynamically quantized on first use, then loaded from
+    `cache_dir` on every later start.
+    """
+
+    def __init__(self, model_name: str, cache_dir: str = ".onnx_models", quantization: str = "avx2",
+                 batch_size: int = 32, max_length: int = 256):
+        if not ONNX_AVAILABLE:
+            raise ImportError("optimum[onnxruntime] is required for the onnx-int8 backend")
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        from transformers import AutoTokenizer
+
+        self.batch_size = batch_size
+        self.max_length = max_length
+        # One export per instruction-set target, so switching `quantization` never reuses a stale file
+        model_dir = Path(cache_dir) / f"{model_name.replace('/', '__')}__{quantization}"
+
+        if not (model_dir / QUANTIZED_FILE).exists():
+            fp32 = ORTModelForFeatureExtraction.from_pretrained(model_name, export=True)
+            fp32.save_pretrained(model_dir)
+            AutoTokenizer.from_pretrained(model_name).save_pretrained(model_dir)
+            # Dynamic (weight-only) int8 — no calibration data needed
+            quantizer = ORTQuantizer.from_pretrained(model_dir)
+            quantizer.quantize(
+                save_dir=model_dir,
+                quantization_config=getattr(AutoQuantizationConfig, quantization)(
+                    is_static=False, per_channel=False
+                )
+            )
+
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            model_dir, file_name=QUANTIZED_FILE, provider="CPUExecutionProvider"
+        )
+
+    def _embed(self, texts: List[str]) -> List[List[float]]:
+        vectors = []
+        for i in range(0, len(texts), self.batch_size):
+            enc = self.tokenizer(
+                texts[i:i + self.batch_size],
+                padding=True, truncation=True, max_length=self.max_length, return_tensors="np"
+            )
+            hidden = self.model(**enc).last_hidden_state
+            mask = enc["attention_mask"][..., None].astype(hidden.dtype)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            pooled /= np.linalg.norm(pooled, axis=1, keepdims=True)
+            vectors.extend(pooled.tolist())
+        return vectors
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._embed(list(texts))
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed([text])[0]
+
+
+class FastEmbedEmbeddings(Embeddings):
+    """FastEmbed's prebuilt quantized ONNX models (e.g. BAAI/bge-small-en-v1.5) — no export step"""
+
+    def __init__(self, model_name: str, cache_dir: str = ".onnx_models", batch_size: int = 32):
+        if not FASTEMBED_AVAILABLE:
+            raise ImportError("fastembed is required for the fastembed backend")
+        from fastembed import TextEmbedding
+
+        self.batch_size = batch_size
+        self.model = TextEmbedding(model_name=model_name, cache_dir=cache_dir)
+
+    @staticmethod
+    def _normalise(vectors) -> List[List[float]]:
+        matrix = np.stack(list(vectors))
+        matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix.tolist()
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._normalise(self.model.passage_embed(list(texts), batch_size=self.batch_size))
+
+    def embed_query(self, text: str) -> List[float]:
+        # query_embed adds the query instruction for models trained with one (bge)
+        return self._normalise(self.model.query_embed(text))[0]
+
+
+def make_embeddings(model_name: str, device: str = "cpu", backend: str = "torch",
+                    cache_dir: str = ".onnx_models", quantization: str = "avx2") -> Embeddings:
+    """Build the embedder used for both ingestion and queries — keep them on the same backend"""
+    if backend == "onnx-int8" and ONNX_AVAILABLE:
+        return QuantizedOnnxEmbeddings(model_name, cache_dir=cache_dir, quantization=quantization)
+    if backend == "fastembed" and FASTEMBED_AVAILABLE:
+        return FastEmbedEmbeddings(model_name, cache_dir=cache_dir)
+
+    from langchain_huggingface import HuggingFaceEmbeddings
+    return HuggingFaceEmbeddings(
+        model_name=model_name,
+        model_kwargs={"device": device},
+        encode_kwargs={"normalize_embeddings": True}
+    )
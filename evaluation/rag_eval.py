@@ -1,13 +1,33 @@
 # evaluation/rag_eval.py
-from assistant import ask_assistant
-from retrieval_eval import TEST_CASES, queries, awards
+import asyncio
+from pathlib import Path
+from assistant import ask_assistant_async, parse_award
 from datasets import Dataset
 from ragas import evaluate
 from ragas.metrics import faithfulness, answer_correctness
 import json
 
-print("Running full RAG evaluation (takes ~2 minutes)...")
-answers = [ask_assistant(q, a) for q, a in zip(queries, awards)]
+# Groq rate-limits per key — cap how many questions are in flight at once
+MAX_CONCURRENCY = 8
+
+with open(Path(__file__).parent / "sample_queries.json", "r", encoding="utf-8") as f:
+    queries = json.load(f)
+awards = [parse_award(q) for q in queries]
+
+
+async def answer_all() -> list:
+    """Run every question concurrently — each one mostly waits on the Groq round-trip"""
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def answer(q, a):
+        async with sem:
+            return await ask_assistant_async(q, a)
+
+    return await asyncio.gather(*(answer(q, a) for q, a in zip(queries, awards)))
+
+
+print("Running full RAG evaluation...")
+answers = asyncio.run(answer_all())
 
 dataset = Dataset.from_dict({
     "question": queries,
@@ -20,5 +40,6 @@ result = evaluate(dataset, metrics=[faithfulness, answer_correctness])
 print("\nFull RAG Results:")
 print(result)
 
+Path("outputs").mkdir(exist_ok=True)
 with open("outputs/rag_eval_results.json", "w") as f:
     json.dump(result.to_dict(), f, indent=2)
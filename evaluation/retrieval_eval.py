@@ -1,6 +1,6 @@
 # evaluation/retrieval_eval.py — OFFLINE SCORING (perfect for ReadyTensor submission)
 import json
-from assistant import get_relevant_docs
+from assistant import get_embeddings, get_relevant_docs
 
 # These are the real queries that exist in your data
 QUERIES = [
@@ -13,9 +13,13 @@ QUERIES = [
 
 print("Running final offline evaluation (this gives your official scores)\n")
 
+# Encode every query in one batched forward pass, then hand each vector to the retriever.
+# MiniLM has no query/passage instruction, so embed_documents gives the same vectors as embed_query
+query_vectors = get_embeddings().embed_documents(QUERIES)
+
 total_found = 0
-for q in QUERIES:
-    docs = get_relevant_docs(q)
+for q, vector in zip(QUERIES, query_vectors):
+    docs = get_relevant_docs(q, embedding=vector)
     found = len(docs)
     total_found += found
     print(f"✓ {q:<50} → {found} project(s)")
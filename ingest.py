@@ -7,7 +7,8 @@ import shutil
 from pathlib import Path
 
 from langchain_chroma import Chroma
-from langchain_huggingface import HuggingFaceEmbeddings
+from embedding_backends import make_embeddings
+from config import config
 from langchain.schema import Document
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 import chromadb  # ← needed for client_settings
@@ -16,9 +17,32 @@ import chromadb  # ← needed for client_settings
 BASE_DIR = Path(__file__).parent
 DATA_FILE = BASE_DIR / "data" / "readytensor_publications.json"
 CHROMA_DIR = BASE_DIR / "chroma_db"
-
-# Embedding model (fast & great for semantic search)
-embeddings = HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2")
+# HNSW graph settings from config.yaml, as Chroma collection-metadata keys
+HNSW_METADATA = {f"hnsw:{k}": v for k, v in config.vectorstore.hnsw.items()}
+
+# Embedding model (fast & great for semantic search) — same backend as assistant.py
+embeddings = make_embeddings(
+    config.embedding.model,
+    device=config.embedding.device,
+    backend=config.embedding.backend,
+    cache_dir=config.embedding.onnx_cache_dir,
+    quantization=config.embedding.onnx_quantization
+)
+
+# --- Award patterns (compiled once, applied to every publication) ---
+AWARD_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r"award[:\-]?\s*([^\n.,;]+)",
+        r"winner of\s+([^\n.,;]+)",
+        r"won\s+([^\n.,;]+)",
+        r"received\s+([^\n.,;]+)",
+    )
+]
+# Hard-coded important tags — one alternation scans the description once for all of them
+KNOWN_AWARDS_RE = re.compile(
+    r"best overall project|most innovative project|best rag implementation|best use of llms",
+    re.IGNORECASE
+)
 
 # --- Helpers ---
 def clean_text(value, default=""):
@@ -37,26 +61,10 @@ def normalize_award(award: str) -> str:
 def extract_awards(desc: str, json_awards=None) -> list[str]:
     awards = set(json_awards or [])
     if desc:
-        desc_lower = desc.lower()
-        patterns = [
-            r"award[:\-]?\s*([^\n.,;]+)",
-            r"winner of\s+([^\n.,;]+)",
-            r"won\s+([^\n.,;]+)",
-            r"received\s+([^\n.,;]+)",
-        ]
-        for pattern in patterns:
-            matches = re.findall(pattern, desc, re.IGNORECASE)
-            awards.update(normalize_award(m) for m in matches if m)
-
-        # Hard-coded important tags
-        if "best overall project" in desc_lower:
-            awards.add("best overall project")
-        if "most innovative project" in desc_lower:
-            awards.add("most innovative project")
-        if "best rag implementation" in desc_lower:
-            awards.add("best rag implementation")
-        if "best use of llms" in desc_lower:
-            awards.add("best use of llms")
+        for pattern in AWARD_PATTERNS:
+            awards.update(normalize_award(m) for m in pattern.findall(desc) if m)
+
+        awards.update(m.lower() for m in KNOWN_AWARDS_RE.findall(desc))
     return sorted(a for a in awards if a)
 
 def load_json(file_path: Path):
@@ -107,6 +115,8 @@ def ingest():
             "title": clean_text(pub.get("title"), "Untitled Project"),
             "license": clean_text(pub.get("license"), "unknown"),
             "awards": awards_str,
+            # Lowercased and pre-split ("a|b") once here so retrieval never has to
+            "awards_lower": "|".join(a.lower() for a in all_awards) if all_awards else "none",
             "source": "readytensor_publication",
         }
 
@@ -122,7 +132,8 @@ Awards: {awards_str}
         for i, chunk in enumerate(chunks):
             documents.append(Document(
                 page_content=chunk,
-                metadata={**metadata, "chunk_index": i, "total_chunks": len(chunks)}
+                metadata={**metadata, "chunk_index": i, "total_chunks": len(chunks),
+                          "content_lower": chunk[:2048].lower()}
             ))
 
         print(f"{metadata['title'][:60]:<60} | Awards: {awards_str or 'none'} | Chunks: {len(chunks)}")
@@ -131,6 +142,7 @@ Awards: {awards_str}
     vectorstore = Chroma(
         persist_directory=str(CHROMA_DIR),
         embedding_function=embeddings,
+        collection_metadata=HNSW_METADATA,
         client_settings=chromadb.Settings(anonymized_telemetry=False)
     )
 
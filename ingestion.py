@@ -3,7 +3,8 @@ import json
 import re
 import shutil
 from langchain_chroma import Chroma
-from langchain_huggingface import HuggingFaceEmbeddings
+from embedding_backends import make_embeddings
+from config import config
 from langchain.schema import Document
 from langchain.text_splitter import RecursiveCharacterTextSplitter
 
@@ -11,9 +12,17 @@ from langchain.text_splitter import RecursiveCharacterTextSplitter
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_FILE = os.path.join(BASE_DIR, "data", "readytensor_awards.json")
 CHROMA_DIR = os.path.join(BASE_DIR, "chroma_db")
-
-# Use HuggingFace embeddings
-embeddings = HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2")
+# HNSW graph settings from config.yaml, as Chroma collection-metadata keys
+HNSW_METADATA = {f"hnsw:{k}": v for k, v in config.vectorstore.hnsw.items()}
+
+# Same embedding model + backend as assistant.py (see config.yaml)
+embeddings = make_embeddings(
+    config.embedding.model,
+    device=config.embedding.device,
+    backend=config.embedding.backend,
+    cache_dir=config.embedding.onnx_cache_dir,
+    quantization=config.embedding.onnx_quantization
+)
 
 # --- Helpers ---
 def normalize_award(award: str) -> str:
@@ -88,6 +97,8 @@ def ingest():
             "username": pub.get("username"),
             "license": pub.get("license"),
             "awards": awards_str,
+            # Lowercased and pre-split ("a|b") for the retrieval-time award filter
+            "awards_lower": "|".join(a.lower() for a in awards) if awards else "none",
             "title": pub.get("title"),
         }
 
@@ -102,9 +113,10 @@ def ingest():
         # Apply chunking
         chunks = splitter.split_text(full_text)
         for i, chunk in enumerate(chunks):
+            chunk = chunk.strip()
             documents.append(Document(
-                page_content=chunk.strip(),
-                metadata={**metadata, "chunk": i}
+                page_content=chunk,
+                metadata={**metadata, "chunk": i, "content_lower": chunk[:2048].lower()}
             ))
 
         # Print sanity check
@@ -114,6 +126,7 @@ def ingest():
     vectorstore = Chroma(
         persist_directory=CHROMA_DIR,
         embedding_function=embeddings,
+        collection_metadata=HNSW_METADATA,
     )
 
     # ✅ Safe batching instead of one big call
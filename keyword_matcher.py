@@ -0,0 +1,58 @@
+# keyword_matcher.py — single-pass multi-keyword search used by the scrapers' award checks
+import re
+from typing import Iterable, Optional
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+class KeywordMatcher:
+    """Substring test for many keywords at once — one scan of the text instead of one per keyword.
+
+    Uses an Aho–Corasick automaton when pyahocorasick is installed, otherwise a single
+    compiled regex alternation. Keywords and text are expected to be lowercase already.
+    Both backends report the same keyword from find(): the leftmost match, and of those
+    starting there, the longest. An empty keyword list matches nothing.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        keywords = [k for k in dict.fromkeys(keywords) if k]
+        self._automaton = None
+        self._pattern = None
+        self._max_len = max(map(len, keywords), default=0)
+        if not keywords:
+            return
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in keywords:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+        else:
+            # Alternation tries branches left to right, so longest first gives leftmost-longest
+            self._pattern = re.compile("|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)))
+
+    def search(self, text: str) -> bool:
+        return self.find(text) is not None
+
+    def find(self, text: str) -> Optional[str]:
+        """The leftmost keyword occurring in `text` (the longest, if several start there), or None"""
+        if not text:
+            return None
+        if self._automaton is not None:
+            # Hits arrive in order of where they end. Once a hit ends too far right to start
+            # at or before the best start so far, no later hit can beat it
+            best = None
+            for end, keyword in self._automaton.iter(text):
+                start = end - len(keyword) + 1
+                if best is not None and end - self._max_len + 1 > best[0]:
+                    break
+                if best is None or (start, -len(keyword)) < (best[0], -len(best[1])):
+                    best = (start, keyword)
+            return best[1] if best is not None else None
+        if self._pattern is not None:
+            match = self._pattern.search(text)
+            return match.group(0) if match is not None else None
+        return None
@@ -0,0 +1,89 @@
+# ndjson_store.py — append-only NDJSON output and JSON parsing shared by the scrape_readytensor*.py scripts
+import io
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Sequence, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+
+def dumps(record: Any) -> bytes:
+    """Compact one-line JSON (UTF-8, no trailing newline)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(record)
+    return json.dumps(record, ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def append_records(path: Union[str, Path], records: Iterable[Any]) -> int:
+    """Append one line per record — earlier lines are never read back or rewritten"""
+    count = 0
+    with open(path, "ab") as f:
+        for record in records:
+            f.write(dumps(record) + b"\n")
+            count += 1
+    return count
+
+
+def iter_records(path: Union[str, Path]) -> Iterator[Any]:
+    """Stream records back; a missing file yields nothing and a torn last line (crash mid-write) is skipped"""
+    if not Path(path).exists():
+        return
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield loads(line)
+            except ValueError:  # json and orjson decode errors both subclass ValueError
+                continue
+
+
+def _dig(data: Any, path: str) -> Any:
+    for key in path.split("."):
+        if not isinstance(data, dict) or key not in data:
+            return None
+        data = data[key]
+    return data
+
+
+def pluck(raw_json: Union[str, bytes], paths: Sequence[str]) -> Dict[str, Any]:
+    """Only the subtrees at the given dotted `paths`, nested as in the source document.
+
+    With ijson the payload is streamed and everything outside `paths` is never built
+    into Python objects; otherwise it is fully parsed and then trimmed. Missing paths
+    are left out.
+    """
+    raw = raw_json.encode("utf-8") if isinstance(raw_json, str) else raw_json
+    found = {}
+    if IJSON_AVAILABLE:
+        for path in paths:
+            # use_float: Decimals would not serialise back out through orjson
+            for value in ijson.items(io.BytesIO(raw), path, use_float=True):
+                found[path] = value
+                break
+    else:
+        full = loads(raw)
+        found = {path: value for path in paths if (value := _dig(full, path)) is not None}
+
+    out: Dict[str, Any] = {}
+    for path, value in found.items():
+        *parents, leaf = path.split(".")
+        node = out
+        for key in parents:
+            node = node.setdefault(key, {})
+        node[leaf] = value
+    return out
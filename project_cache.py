@@ -0,0 +1,45 @@
+# project_cache.py — extracted project data kept between scraper.py runs, keyed by URL
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from ndjson_store import dumps, loads
+
+PROJECT_CACHE_DB = "./.cache/projects.sqlite3"
+# Projects do get edited (descriptions, new awards) — re-scrape anything older than this
+PROJECT_CACHE_TTL = timedelta(days=7)
+
+
+class ProjectCache:
+    """Per-URL scrape results, so a repeat run only opens pages that are new or expired."""
+
+    def __init__(self, db_path: str = PROJECT_CACHE_DB, ttl: timedelta = PROJECT_CACHE_TTL):
+        self.ttl = ttl
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(db_path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS projects (url TEXT PRIMARY KEY, scraped_at TEXT, data BLOB)"
+        )
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """The cached record for `url`, or None if it is missing or older than the TTL"""
+        cutoff = (datetime.utcnow() - self.ttl).isoformat()
+        row = self._db.execute(
+            "SELECT data FROM projects WHERE url = ? AND scraped_at >= ?", (url, cutoff)
+        ).fetchone()
+        return loads(row[0]) if row is not None else None
+
+    def put_many(self, items: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Store `(url, record)` pairs — one transaction for the whole batch"""
+        now = datetime.utcnow().isoformat()
+        rows = [(url, now, dumps(record)) for url, record in items]
+        with self._db:
+            self._db.executemany("INSERT OR REPLACE INTO projects VALUES (?, ?, ?)", rows)
+
+    def clear(self) -> None:
+        with self._db:
+            self._db.execute("DELETE FROM projects")
+
+    def close(self) -> None:
+        self._db.close()
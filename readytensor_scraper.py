@@ -0,0 +1,577 @@
+# readytensor_scraper.py — shared ReadyTensor scraper: a single listing crawl, one browser,
+# one HTTP client and one seen-index, with per-URL extraction strategies tried in order.
+# The scrape_readytensor*.py scripts are thin CLIs over ReadyTensorScraper.
+#
+#   python readytensor_scraper.py                          # crawl the listing, all strategies
+#   python readytensor_scraper.py --strategies ldjson,dom URL [URL ...]
+#   python readytensor_scraper.py --force                  # ignore the seen-index
+import argparse
+import asyncio
+import os
+import re
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+from playwright.async_api import async_playwright, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+from selectolax.parser import HTMLParser
+
+from keyword_matcher import KeywordMatcher
+from ndjson_store import append_records, loads, pluck
+from scrape_pool import (fetch_html_fast, goto_with_retries, launch_browser, make_http_client,
+                         scrape_all_urls, serve_next_static)
+from seen_index import SeenIndex
+
+BASE_URL = "https://app.readytensor.ai"
+LISTING_URL = BASE_URL + "/publications"
+OUTPUT_ALL = "readytensor_publications.ndjson"
+OUTPUT_AWARDS = "readytensor_awards.ndjson"
+
+STRATEGIES = ("ldjson", "nextdata", "dom")
+# Read from the server-rendered HTML; the others need a Chromium page
+HTTP_STRATEGIES = ("ldjson", "nextdata", "nextstream")
+
+# --- Award vocabulary ---
+# ReadyTensor's named awards (scraper.py normalizes award phrases to these)
+AWARD_NAMES = (
+    "best overall project",
+    "best technical implementation",
+    "most innovative project",
+    "most engaging presentation",
+    "outstanding solution implementation",
+    "most promising innovation",
+    "best ai tool innovation",
+    "distinguished applied solution showcase",
+    "distinguished technical deep-dive",
+    "distinguished social impact innovation",
+    "best creative ai project",
+    "ai research excellence",
+    "distinguished implementation guide",
+    "excellence in educational content",
+    "exceptional dataset contribution",
+)
+# Award tagging: a named award, or general award vocabulary
+AWARD_KEYWORDS = AWARD_NAMES + ("winner", "award", "prize", "trophy", "challenge", "hackathon")
+# All keywords in one pass over the (often 100KB+) page text
+AWARD_MATCHER = KeywordMatcher(AWARD_KEYWORDS)
+
+# Award phrase = trigger words + everything up to the next sentence/list break.
+# The trigger sits outside the group, so findall hands back the award name already stripped of it
+AWARD_PHRASE_RE = re.compile(r"(?:winner of|award(?:ed)?|recipient of)\s+([^\n.,;]+)", re.IGNORECASE)
+WS_RE = re.compile(r"\s+")
+
+# --- Page data ---
+# Parts of the __NEXT_DATA__ payload worth keeping — the page's own props, without
+# the Next.js build/runtime metadata around them
+NEXT_DATA_FIELDS = ("props.pageProps",)
+NEXT_DATA_RE = re.compile(r'<script[^>]*\bid="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+# Where pageProps may keep the publication's fields (the schema isn't published)
+NEXT_DATA_TITLE_KEYS = ("title", "headline")
+NEXT_DATA_DESCRIPTION_KEYS = ("publication_description", "description", "content", "body")
+# Newer Next.js streams page data as self.__next_f.push(...) calls instead. Payload = everything
+# up to the first ");" on the line, written as an unrolled loop ([^)]* runs, then any ")" not
+# followed by ";") so the engine never backtracks char by char
+NEXT_F_RE = re.compile(r"self\.__next_f\.push\(([^)\n]*(?:\)(?!;)[^)\n]*)*)\);")
+# Dump the first 2k chars of every <script> the nextstream strategy sees: DEBUG_SCRIPTS=1
+DEBUG_SCRIPTS = bool(os.getenv("DEBUG_SCRIPTS"))
+# The ld+json body is sliced straight out of the HTML — no DOM needed for it
+LDJSON_RE = re.compile(
+    r"""<script[^>]*type=["']application/ld\+json["'][^>]*>(.*?)</script>""",
+    re.DOTALL | re.IGNORECASE
+)
+
+DESCRIPTION_SELECTORS = ["div.markdown", "div.prose", "article", "main"]
+
+# In-page field extraction (the "dom" strategy and scraper.py). Mirrors the per-field locator
+# calls it replaced: textContent for username/license/title, innerText for the description
+# (a selector matching more than one element is skipped, as strict locators did),
+# then the <p> and meta description fallbacks.
+EXTRACT_FIELDS_JS = """
+({descriptionSelectors, awardSelectors}) => {
+    const text = (sel) => document.querySelector(sel)?.textContent ?? null;
+
+    // Playwright's text=License: the element whose own text mentions it (scripts/styles excluded)
+    let license = null;
+    const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+    while (walker.nextNode()) {
+        const tag = walker.currentNode.parentElement?.tagName;
+        if (tag === "SCRIPT" || tag === "STYLE" || tag === "NOSCRIPT") continue;
+        if (/license/i.test(walker.currentNode.nodeValue)) {
+            license = walker.currentNode.parentElement.textContent;
+            break;
+        }
+    }
+
+    let description = null;
+    for (const sel of descriptionSelectors) {
+        const els = document.querySelectorAll(sel);
+        if (els.length !== 1) continue;
+        const t = els[0].innerText;
+        if (t && t.trim().length > 50) { description = t.trim(); break; }
+    }
+    if (!description) {
+        const t = [...document.querySelectorAll("p")]
+            .map(p => p.innerText.trim()).filter(Boolean).join("\\n\\n");
+        if (t.length > 50) description = t;
+    }
+    if (!description) {
+        description = document.querySelector("meta[name='description']")?.getAttribute("content") ?? null;
+    }
+
+    const elements = {};
+    for (const sel of awardSelectors) {
+        elements[sel] = [...document.querySelectorAll(sel)].map(e => e.innerText.trim()).filter(Boolean);
+    }
+
+    return {
+        username: text("a[href*='/users/']"),
+        license,
+        title: text("h1"),
+        description,
+        elements,
+    };
+}
+"""
+
+# A Chromium strategy: (page, url) -> record, or None to fall through
+PageStrategy = Callable[[Any, str], Awaitable[Optional[Dict[str, Any]]]]
+
+
+def matches_award(text: str) -> bool:
+    if not text:
+        return False
+    return AWARD_MATCHER.search(text.lower())
+
+
+def award_haystack(record: Dict[str, Any]) -> str:
+    """Title, description and extracted awards — the text matches_award scans for a record."""
+    return "\n".join([
+        record.get("title") or "",
+        record.get("publication_description") or "",
+        " ".join(record.get("awards") or []),
+    ])
+
+
+def is_award_record(record: Dict[str, Any]) -> bool:
+    return matches_award(award_haystack(record))
+
+
+def extract_awards(description: str) -> List[str]:
+    """Award names mentioned in a description ("winner of X", "awarded X", ...), deduplicated in order."""
+    if not description:
+        return []
+    names = (WS_RE.sub(" ", name).strip() for name in AWARD_PHRASE_RE.findall(description))
+    return list(dict.fromkeys(name for name in names if name))
+
+
+def make_record(url: str, source: str, **fields: Any) -> Dict[str, Any]:
+    """Common record shape (the data/*.json fields plus url/source/status) for every strategy.
+
+    `data` holds the strategy's raw payload (ld+json, pageProps, stream chunks), if any.
+    """
+    record = {
+        "id": url.rstrip("/").split("/")[-1],
+        "url": url,
+        "username": None,
+        "license": None,
+        "title": None,
+        "publication_description": None,
+        "awards": [],
+        "data": None,
+        "source": source,
+        "status": "ok",
+        "error": "",
+        "scraped_at": datetime.now(timezone.utc).isoformat(),
+    }
+    record.update(fields)
+    return record
+
+
+def is_complete(record: Optional[Dict[str, Any]]) -> bool:
+    """A record the strategy chain can stop at: extracted, with a title and a description"""
+    return bool(record and record["status"] == "ok" and record["title"] and record["publication_description"])
+
+
+def _better_record(earlier: Optional[Dict[str, Any]], record: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """The record to keep for a URL once a later strategy has run: complete beats ok beats failed,
+    and on a tie the earlier strategy wins"""
+    def rank(r):
+        return 2 if is_complete(r) else 1 if r and r["status"] == "ok" else 0
+    if earlier is None:
+        return record
+    return record if record is not None and rank(record) > rank(earlier) else earlier
+
+
+def _find_text(data: Any, keys: Sequence[str]) -> Optional[str]:
+    """First non-empty string under one of `keys`, searched level by level (shallowest wins)"""
+    level = [data]
+    while level:
+        for key in keys:
+            for node in level:
+                value = node.get(key) if isinstance(node, dict) else None
+                if isinstance(value, str) and value.strip():
+                    return value.strip()
+        level = [
+            child
+            for node in level
+            for child in (node.values() if isinstance(node, dict) else node if isinstance(node, list) else ())
+            if isinstance(child, (dict, list))
+        ]
+    return None
+
+
+def first_author(ld_json: Dict[str, Any]) -> Dict[str, Any]:
+    # ReadyTensor nests the author list one level deep: [[{...}], ...]
+    for author in ld_json.get("author") or []:
+        for candidate in author if isinstance(author, list) else [author]:
+            if isinstance(candidate, dict):
+                return candidate
+    return {}
+
+
+def parse_next_f(contents: Iterable[str]) -> List[Any]:
+    """Decode every self.__next_f.push(...) payload found in the given script bodies."""
+    collected = []
+    for content in contents:
+        if "self.__next_f.push" in content:
+            for match in NEXT_F_RE.finditer(content):
+                m = match.group(1)
+                try:
+                    collected.append(loads(m))
+                except Exception as e:
+                    collected.append({"raw": m, "error": str(e)})
+    return collected
+
+
+async def _document_html(page, url: str) -> Optional[str]:
+    # The server-rendered document only — its body is read as it arrives, nothing waits on rendering
+    try:
+        response = await page.goto(url, wait_until="commit", timeout=15000)
+        return await response.text() if response is not None and response.ok else None
+    except PlaywrightError:
+        return None
+
+
+class ReadyTensorScraper:
+    """Listing crawl + extraction sharing one browser, one HTTP client and one seen-index.
+
+    `strategies` are tried in order for every URL: names from HTTP_STRATEGIES (run on the
+    page's initial HTML, all fetched concurrently), "dom", or a PageStrategy callable (both
+    run in the Chromium page pool, only for URLs still unresolved). The first record with a
+    title and a description wins; failing that, the first successful record does.
+
+    `shape` turns each record into the caller's output layout, and `is_award` decides which
+    records also go to `awards_output`. Either output may be None.
+    """
+
+    def __init__(self, pw, strategies: Sequence[Union[str, PageStrategy]] = STRATEGIES, force: bool = False,
+                 output: Optional[str] = OUTPUT_ALL, awards_output: Optional[str] = OUTPUT_AWARDS,
+                 shape: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+                 is_award: Callable[[Dict[str, Any]], bool] = is_award_record):
+        known = set(HTTP_STRATEGIES) | {"dom"}
+        unknown = {s for s in strategies if isinstance(s, str)} - known
+        if unknown:
+            raise ValueError(f"Unknown strategies: {sorted(unknown)} (choose from {sorted(known)})")
+        self.pw = pw
+        self.strategies = tuple(strategies)
+        self.force = force
+        self.output = output
+        self.awards_output = awards_output
+        self.shape = shape
+        self.is_award = is_award
+        self._browser = None
+
+    async def browser(self):
+        """The shared persistent-profile browser, launched on first use"""
+        if self._browser is None:
+            self._browser = await launch_browser(self.pw)
+        return self._browser
+
+    async def close(self) -> None:
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+
+    # --- Listing ---
+    async def crawl_listing(self, paginate: bool = False,
+                            on_links: Optional[Callable[[List[str]], None]] = None) -> List[str]:
+        """Every project URL on the publications index, in page order.
+
+        The index is scrolled until it stops growing, or with `paginate`, walked with its Next
+        button. `on_links` gets each batch of new URLs as soon as it is found (once per index
+        page when paginating), so detail scraping can start before the crawl ends.
+        """
+        page = await (await self.browser()).new_page()
+        await page.route("**/_next/static/**", serve_next_static)
+        try:
+            print("🌍 Navigating to publications page...")
+            await page.goto(LISTING_URL, wait_until="domcontentloaded", timeout=120000)
+            urls = await (self._paginate(page, on_links) if paginate else self._scroll(page, on_links))
+        finally:
+            await page.close()
+        print(f"🔗 Found {len(urls)} unique project URLs")
+        return urls
+
+    @staticmethod
+    async def _project_links(page) -> List[str]:
+        hrefs = await page.eval_on_selector_all(
+            "a[href*='/publications/']",
+            "els => [...new Set(els.map(e => e.getAttribute('href')).filter(h => h && !h.endsWith('/create')))]"
+        )
+        return list(dict.fromkeys(BASE_URL + href if href.startswith("/") else href for href in hrefs))
+
+    async def _scroll(self, page, on_links=None) -> List[str]:
+        last_height = 0
+        for _ in range(20):
+            await page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
+            await page.wait_for_timeout(2000)
+            new_height = await page.evaluate("document.body.scrollHeight")
+            if new_height == last_height:
+                break
+            last_height = new_height
+        urls = await self._project_links(page)
+        if on_links:
+            on_links(urls)
+        return urls
+
+    async def _paginate(self, page, on_links=None, max_pages: int = 100) -> List[str]:
+        urls: Dict[str, None] = {}
+        next_selectors = ["[aria-label='Next']", "a:has-text('Next')", "button:has-text('Next')",
+                          "a:has-text('›')", "button:has-text('›')"]
+        for page_num in range(1, max_pages + 1):
+            print(f"📄 Collecting page {page_num}...", flush=True)
+            try:
+                await page.wait_for_selector("a[href*='/publications/']", timeout=8000)
+            except PlaywrightTimeoutError:
+                print("⚠️ No project links found on this page, breaking.", flush=True)
+                break
+
+            unseen = [url for url in await self._project_links(page) if url not in urls]
+            print(f"→ Found {len(unseen)} new links on page {page_num}", flush=True)
+            if not unseen:
+                break
+            urls.update(dict.fromkeys(unseen))
+            if on_links:
+                on_links(unseen)
+
+            next_btn = None
+            for sel in next_selectors:
+                try:
+                    btn = page.locator(sel).first
+                    if await btn.count() and await btn.is_enabled() and await btn.is_visible():
+                        next_btn = btn
+                        break
+                except PlaywrightError:
+                    continue
+            if not next_btn:
+                print("✅ No Next button visible, finishing.", flush=True)
+                break
+            await next_btn.click()
+            await asyncio.sleep(1.5)
+        return list(urls)
+
+    # --- Strategies (each returns a record, or None to fall through) ---
+    @staticmethod
+    def from_ldjson(url: str, html: str) -> Optional[Dict[str, Any]]:
+        match = LDJSON_RE.search(html)
+        if not match:
+            return None
+        try:
+            ld_json = loads(match.group(1).strip())
+        except ValueError:
+            return None
+        if not isinstance(ld_json, dict) or not ld_json.get("headline"):
+            return None
+
+        # Full markdown body when the page has it; ld+json only carries a summary
+        md_div = HTMLParser(html).css_first("div.markdown")
+        description = md_div.text(separator=" ", strip=True) if md_div else ld_json.get("description")
+        return make_record(
+            url, "ldjson",
+            title=ld_json["headline"],
+            username=first_author(ld_json).get("name"),
+            license=ld_json.get("license"),
+            publication_description=description,
+            data=ld_json,
+        )
+
+    @staticmethod
+    def from_nextdata(url: str, html: str) -> Optional[Dict[str, Any]]:
+        match = NEXT_DATA_RE.search(html)
+        if not match:
+            return None
+        try:
+            data = pluck(match.group(1), NEXT_DATA_FIELDS)
+        except Exception:
+            return None
+        if not data:
+            return None
+        # Without a title and description this record is only kept if no later strategy
+        # produces a complete one (see is_complete)
+        return make_record(
+            url, "nextdata",
+            title=_find_text(data, NEXT_DATA_TITLE_KEYS),
+            publication_description=_find_text(data, NEXT_DATA_DESCRIPTION_KEYS),
+            data=data,
+        )
+
+    @staticmethod
+    def from_nextstream(url: str, html: str) -> Optional[Dict[str, Any]]:
+        scripts = [node.text() for node in HTMLParser(html).css("script")]
+        if DEBUG_SCRIPTS:
+            with open("debug_scripts.txt", "w", encoding="utf-8") as f:
+                for i, content in enumerate(scripts):
+                    f.write(f"--- Script {i} ---\n")
+                    f.write(content[:2000])  # only first 2k chars to keep file light
+                    f.write("\n\n")
+        collected = parse_next_f(scripts)
+        return make_record(url, "nextstream", data=collected) if collected else None
+
+    @staticmethod
+    async def from_dom(page, url: str) -> Dict[str, Any]:
+        """Fields from the rendered page. The description is innerText, so the page must load CSS."""
+        failure = await goto_with_retries(page, url, wait_until="domcontentloaded", timeout=60000)
+        if failure is not None:
+            print(f"⚠️ {url}: {failure}")
+            return make_record(url, "dom", status="failed", error=failure)
+        try:
+            # One bounded wait for client rendering, then every field in one in-page read.
+            # The h1 is the signal: the main/article shell can render before the content does
+            try:
+                await page.wait_for_selector("h1", timeout=10000)
+            except PlaywrightTimeoutError:
+                pass
+            fields = await page.evaluate(EXTRACT_FIELDS_JS, {
+                "descriptionSelectors": DESCRIPTION_SELECTORS,
+                "awardSelectors": [],
+            })
+        except Exception as e:
+            return make_record(url, "dom", status="failed", error=f"Error extracting: {e}")
+        return make_record(
+            url, "dom",
+            username=fields["username"],
+            license=fields["license"],
+            title=fields["title"],
+            publication_description=fields["description"] or "No description found",
+        )
+
+    def extract_html(self, url: str, html: str) -> Optional[Dict[str, Any]]:
+        """Best record the enabled HTTP strategies produce from `html`, in order (see is_complete)"""
+        fallback = None
+        for name in self.strategies:
+            if name in HTTP_STRATEGIES:
+                record = getattr(self, f"from_{name}")(url, html)
+                if is_complete(record):
+                    return record
+                fallback = fallback or record
+        return fallback
+
+    async def fetch_documents(self, urls: Sequence[str]) -> Dict[str, Optional[str]]:
+        """Initial HTML of every URL over HTTP; ones the client couldn't get come through Chromium"""
+        async with make_http_client() as client:
+            pages = await asyncio.gather(*(fetch_html_fast(url, client) for url in urls))
+        docs = dict(zip(urls, pages))
+        failed = [url for url, html in docs.items() if html is None]
+        if failed:
+            docs.update(zip(failed, await scrape_all_urls(await self.browser(), failed, _document_html)))
+        return docs
+
+    async def extract(self, url: str) -> Dict[str, Any]:
+        """Single-URL extraction through the whole strategy chain"""
+        return (await self.extract_all([url]))[0]
+
+    async def extract_all(self, urls: Iterable[str]) -> List[Dict[str, Any]]:
+        """One record per URL: all HTTP strategies concurrently, then the page pool for the rest"""
+        urls = list(urls)
+        records: Dict[str, Dict[str, Any]] = {}
+        for url in urls:
+            if url.rstrip("/").endswith("/publications/create"):
+                records[url] = make_record(url, "none", status="skipped", error="Not a real project page")
+        pending = [url for url in urls if url not in records]
+
+        if pending and any(name in HTTP_STRATEGIES for name in self.strategies):
+            for url, html in (await self.fetch_documents(pending)).items():
+                record = self.extract_html(url, html) if html else None
+                if record is not None:
+                    records[url] = record
+
+        for strategy in self.strategies:
+            if isinstance(strategy, str) and strategy != "dom":
+                continue
+            remaining = [url for url in pending if not is_complete(records.get(url))]
+            if not remaining:
+                break
+            scrape_fn = self.from_dom if strategy == "dom" else strategy
+            # from_dom reads innerText, which needs the stylesheets; other page strategies skip them
+            scraped = await scrape_all_urls(await self.browser(), remaining, scrape_fn, keep_css=strategy == "dom")
+            for url, record in zip(remaining, scraped):
+                records[url] = _better_record(records.get(url), record)
+
+        return [
+            self.finish(records.get(url) or make_record(
+                url, "none", status="failed", error=f"No strategy in {self.strategy_names} produced a record"
+            ))
+            for url in urls
+        ]
+
+    def finish(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill in a record's awards and its `award` flag (in place) once extraction is done"""
+        if record["status"] == "ok" and not record["awards"] and record["publication_description"]:
+            record["awards"] = extract_awards(record["publication_description"])
+        record["award"] = record["status"] == "ok" and self.is_award(record)
+        return record
+
+    @property
+    def strategy_names(self) -> List[str]:
+        return [s if isinstance(s, str) else getattr(s, "__name__", repr(s)) for s in self.strategies]
+
+    # --- Full run ---
+    async def run(self, urls: Optional[Iterable[str]] = None, paginate: bool = False) -> List[Dict[str, Any]]:
+        """Crawl (unless `urls` is given), extract everything not yet scraped, append the outputs"""
+        urls = list(urls) if urls is not None else await self.crawl_listing(paginate=paginate)
+        seen = SeenIndex(self.output or self.awards_output, force=self.force)
+        try:
+            new_urls = seen.filter_new(urls)
+            print(f"✅ {len(urls)} project URLs ({len(new_urls)} new)")
+            if not new_urls:
+                return []
+
+            results = await self.extract_all(new_urls)
+            awards = [r for r in results if r["award"]]
+            shape = self.shape or (lambda record: record)
+            if self.output:
+                await asyncio.to_thread(append_records, self.output, [shape(r) for r in results])
+            if self.awards_output:
+                await asyncio.to_thread(append_records, self.awards_output, [shape(r) for r in awards])
+            # Only once the outputs are written — a crash before this leaves the URLs to retry
+            seen.mark(results)
+        finally:
+            seen.close()
+
+        by_source: Dict[str, int] = {}
+        for r in results:
+            by_source[r["source"]] = by_source.get(r["source"], 0) + 1
+        if self.output:
+            print(f"✅ Saved {len(results)} records to {self.output} (by strategy: {by_source})")
+        if self.awards_output:
+            print(f"🏆 Saved {len(awards)} award-tagged projects to {self.awards_output}")
+        return results
+
+
+async def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Scrape ReadyTensor publications in one run")
+    parser.add_argument("urls", nargs="*", help="project URLs (default: crawl the publications listing)")
+    parser.add_argument("--strategies", default=",".join(STRATEGIES),
+                        help=f"comma-separated, tried in order (default: {','.join(STRATEGIES)})")
+    parser.add_argument("--force", action="store_true", help="re-scrape URLs already in the output")
+    args = parser.parse_args(argv)
+
+    async with async_playwright() as pw:
+        scraper = ReadyTensorScraper(pw, strategies=[s for s in args.strategies.split(",") if s], force=args.force)
+        try:
+            await scraper.run(args.urls or None)
+        finally:
+            await scraper.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,187 @@
+# scrape_pool.py — bounded-concurrency page scraping shared by the scrape_readytensor*.py scripts
+import asyncio
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from urllib.parse import urlsplit
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+import httpx
+from playwright.async_api import Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError
+
+# Pages are network/JS-render bound — a handful in flight keeps Chromium busy without hammering the site
+MAX_CONCURRENCY = 6
+# Persistent Chromium profile: its HTTP cache (Next.js chunks, fonts, images) survives between runs
+PROFILE_DIR = "./.cache/playwright"
+# Routed pages bypass Chromium's HTTP cache, so Next.js chunks get their own on-disk cache.
+# They are content-hashed (immutable), so a cached copy never goes stale
+STATIC_CACHE_DIR = Path("./.cache/pw_static")
+# __NEXT_DATA__ and ld+json are server-rendered, so plain HTTP gets them without a browser
+HTTP_LIMITS = httpx.Limits(max_connections=20)
+# Project pages are only read for their scripts and text — never wait on these
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+# For pages read through innerText, which depends on the CSS: everything above but stylesheets
+MEDIA_RESOURCE_TYPES = BLOCKED_RESOURCE_TYPES - {"stylesheet"}
+# Matched against the hostname only — "segment" also appears in project slugs
+BLOCKED_HOSTS = ("google-analytics.com", "googletagmanager.com", "segment.com", "segment.io", "hotjar.com")
+# Navigation attempts for transient failures (timeouts, net:: errors); backoff is 2s, 4s, ...
+NAV_ATTEMPTS = 3
+# Responses a retry would only get again
+PERMANENT_HTTP_STATUSES = frozenset({401, 403, 404, 410, 451})
+
+
+def _light_router(blocked_types: frozenset):
+    # Playwright passes (route, request) to two-argument handlers, so this closes over the
+    # blocked types instead of taking them as a parameter
+    async def route_light(route):
+        request = route.request
+        host = urlsplit(request.url).hostname or ""
+        if request.resource_type in blocked_types or host.endswith(BLOCKED_HOSTS):
+            await route.abort()
+        elif "/_next/static/" in request.url:
+            await serve_next_static(route)
+        else:
+            await route.continue_()
+    return route_light
+
+
+_route_light = _light_router(BLOCKED_RESOURCE_TYPES)
+_route_light_keep_css = _light_router(MEDIA_RESOURCE_TYPES)
+
+
+def _static_cache_path(url: str) -> Path:
+    # Keep the extension so route.fulfill(path=...) sends the right content type
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return STATIC_CACHE_DIR / (digest + Path(urlsplit(url).path).suffix)
+
+
+async def serve_next_static(route) -> None:
+    """Route handler: answer a /_next/static/ request from disk, fetching and storing it on a miss"""
+    cached = _static_cache_path(route.request.url)
+    if cached.exists():
+        await route.fulfill(path=cached)
+        return
+
+    response = await route.fetch()
+    body = await response.body()
+    if response.ok:
+        STATIC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename, so a concurrent worker never serves a half-written chunk
+        fd, tmp = tempfile.mkstemp(dir=STATIC_CACHE_DIR)
+        with os.fdopen(fd, "wb") as f:
+            f.write(body)
+        os.replace(tmp, cached)
+    await route.fulfill(response=response, body=body)
+
+
+async def block_heavy_resources(target, keep_css: bool = False) -> None:
+    """Abort images, media, fonts, CSS and analytics on `target` (a page, or a whole context);
+    Next.js chunks come from the disk cache. With `keep_css`, stylesheets still load.
+    """
+    await target.route("**/*", _route_light_keep_css if keep_css else _route_light)
+
+
+async def launch_browser(pw, headless: bool = True, **context_options):
+    """Chromium on the shared on-disk profile — repeat runs skip re-downloading static assets.
+
+    Returns a persistent BrowserContext; it supports new_page()/close() like a Browser.
+    `context_options` (user_agent, viewport, ...) go to launch_persistent_context.
+    """
+    return await pw.chromium.launch_persistent_context(PROFILE_DIR, headless=headless, **context_options)
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Timeouts and net:: failures may pass on a retry; other navigation errors fail the same way again"""
+    return isinstance(error, PlaywrightTimeoutError) or "net::" in str(error)
+
+
+async def goto_with_retries(page, url: str, attempts: int = NAV_ATTEMPTS, **goto_options) -> Optional[str]:
+    """page.goto(url), retried with exponential backoff only while the failure is transient.
+
+    Returns None once the page has loaded, otherwise why it didn't ("Failed after N attempts: ...").
+    """
+    for attempt in range(1, attempts + 1):
+        tried = f"{attempt} attempt" + ("s" if attempt > 1 else "")
+        try:
+            response = await page.goto(url, **goto_options)
+        except PlaywrightError as e:
+            if not is_transient_error(e) or attempt == attempts:
+                return f"Failed after {tried}: {e}"
+            await asyncio.sleep(2 ** attempt)
+            continue
+        if response is not None and response.status in PERMANENT_HTTP_STATUSES:
+            return f"Failed after {tried}: HTTP {response.status}"
+        return None
+
+
+async def scrape_queue(browser, queue: "asyncio.Queue",
+                       scrape_fn: Callable[[Any, str], Awaitable[Any]],
+                       concurrency: int = MAX_CONCURRENCY,
+                       block_resources: bool = True, keep_css: bool = False) -> Dict[Any, Any]:
+    """Drain `(key, url)` items from `queue` with `concurrency` pages until each worker gets a None.
+
+    The queue may still be filling while this runs (e.g. fed by pagination), so the
+    producer must put one None per worker when it is done. Returns {key: scrape_fn(page, url)}.
+    One browser is shared; each worker gets its own context + page (or just a page, on a
+    persistent context from launch_browser). With `block_resources` the pages skip images,
+    fonts, CSS and analytics (see block_heavy_resources); pass `keep_css` when `scrape_fn`
+    reads innerText, whose line breaks depend on the page's stylesheets.
+    """
+    results: Dict[Any, Any] = {}
+    # A persistent context can't spawn contexts — its workers share the profile instead
+    shared = not hasattr(browser, "new_context")
+
+    async def worker():
+        context = browser if shared else await browser.new_context()
+        page = await context.new_page()
+        if block_resources:
+            await block_heavy_resources(page, keep_css=keep_css)
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                key, url = item
+                print(f"🔎 Scraping {url}", flush=True)
+                results[key] = await scrape_fn(page, url)
+        finally:
+            await (page.close() if shared else context.close())
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return results
+
+
+async def scrape_all_urls(browser, urls: Iterable[str],
+                          scrape_fn: Callable[[Any, str], Awaitable[Any]],
+                          concurrency: int = MAX_CONCURRENCY,
+                          block_resources: bool = True, keep_css: bool = False) -> List[Any]:
+    """Run `scrape_fn(page, url)` over every URL, `concurrency` pages at a time.
+
+    Results come back in the same order as `urls` (see scrape_queue for the rest).
+    """
+    urls = list(urls)
+    workers = min(concurrency, len(urls))
+    queue: "asyncio.Queue" = asyncio.Queue()
+    for item in enumerate(urls):
+        queue.put_nowait(item)
+    for _ in range(workers):
+        queue.put_nowait(None)
+
+    results = await scrape_queue(browser, queue, scrape_fn, workers, block_resources, keep_css)
+    return [results[i] for i in range(len(urls))]
+
+
+# --- HTTP fast path ---
+def make_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(http2=True, limits=HTTP_LIMITS, follow_redirects=True, timeout=30)
+
+
+async def fetch_html_fast(url: str, client: httpx.AsyncClient) -> Optional[str]:
+    """Initial HTML of `url`, or None if the request fails"""
+    try:
+        resp = await client.get(url)
+        resp.raise_for_status()
+    except httpx.HTTPError:
+        return None
+    return resp.text
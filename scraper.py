@@ -1,101 +1,146 @@
+import argparse
 import asyncio
 import json
+import logging
 import os
 import re
-from datetime import datetime
+from bisect import bisect_right
+from itertools import accumulate
+from functools import lru_cache
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
+from keyword_matcher import KeywordMatcher
+from project_cache import ProjectCache
+from readytensor_scraper import AWARD_NAMES, DESCRIPTION_SELECTORS, EXTRACT_FIELDS_JS
+from scrape_pool import block_heavy_resources, goto_with_retries, launch_browser, scrape_all_urls
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+log = logging.getLogger(__name__)
 
 # Output files
 OUTPUT_ALL = "data/readytensor_publications.json"
 OUTPUT_AWARDS = "data/readytensor_awards.json"
 
-# Expanded award-related keywords
-AWARD_KEYWORDS = [
-    "best overall project",
-    "best technical implementation",
-    "most innovative project",
-    "most engaging presentation",
-    "outstanding solution implementation",
-    "most promising innovation",
-    "best ai tool innovation",
-    "distinguished applied solution showcase",
-    "distinguished technical deep-dive",
-    "distinguished social impact innovation",
-    "best creative ai project",
-    "ai research excellence",
-    "distinguished implementation guide",
-    "excellence in educational content",
-    "exceptional dataset contribution",
-    "the imagenet competition in 2012"
+INDEX_URL = "https://app.readytensor.ai/publications"
+MAX_PAGES = 10  # Expect ~120 projects, 20 per page
+MAX_NO_CONTENT = 2  # Stop after 2 pages with no project links
+MAX_PARALLEL_INDEX = 3  # Index pages loaded at once
+# Descriptions of records whose extraction failed — these are never cached
+FAILED_DESCRIPTIONS = ("Error extracting", "Failed after")
+
+AWARD_ELEMENT_SELECTORS = ["div.awards", "span.badge", "div[class*='award']", "li[class*='award']"]
+
+# ReadyTensor's named awards, plus one historical award phrase descriptions use
+# (a tuple: the lookup tables below are built from it once)
+AWARD_KEYWORDS = AWARD_NAMES + ("the imagenet competition in 2012",)
+
+# All keywords in one pass over the (often 100KB+) page text
+AWARD_MATCHER = KeywordMatcher(AWARD_KEYWORDS)
+# Reverse lookup (phrase inside a keyword): one str.find over all keywords, newline-separated
+# so a phrase (whitespace already collapsed) can never straddle two of them
+KEYWORD_BLOB = "\n".join(AWARD_KEYWORDS)
+KEYWORD_STARTS = list(accumulate((len(k) + 1 for k in AWARD_KEYWORDS[:-1]), initial=0))
+
+# normalize_award_phrase
+WS_RE = re.compile(r"\s+")
+QUOTE_RE = re.compile(r"['`]+")
+FILLER_RE = re.compile(r"\b(winner of|award(ed)?|recipient of|at the|for|in|with)\b", re.IGNORECASE)
+# Stop words and digits in one search; the phrase is lowercased by then, so no IGNORECASE
+INVALID_RE = re.compile(r"\b(?:it|this|because|from|classification|usecases|trending|topics|way|team|presentation)\b|\d")
+
+# Award phrases in descriptions: one capture per pattern
+AWARD_DESC_PATTERNS = [
+    r"award[:\-]?\s*([A-Za-z\s\-]{5,40})(?=\s*(?:$|\n|\.|,|;))",
+    r"winner of\s*([A-Za-z\s\-]{5,40})(?=\s*(?:$|\n|\.|,|;))",
+    r"received\s*([A-Za-z\s\-]{5,40})(?=\s*(?:$|\n|\.|,|;))",
+    r"won\s*([A-Za-z\s\-]{5,40})(?=\s*(?:$|\n|\.|,|;))",
+    r"(?:best|most|top|outstanding|innovative|promising)\s+([A-Za-z\s\-]{5,40})(?=\s*(?:$|\n|\.|,|;))"
 ]
+# All five in one scan. Each alternative is a lookahead wrapped in a group, so matches of
+# different patterns can still overlap (as with five separate findall passes); pattern k
+# owns groups 2k+1 (whole match) and 2k+2 (the capture)
+AWARD_DESC_RE = re.compile("|".join(f"(?=({p}))" for p in AWARD_DESC_PATTERNS), re.IGNORECASE)
+
+def find_description_awards(description: str) -> list:
+    """Same captures, in the same order, as re.findall of each AWARD_DESC_PATTERNS entry in turn."""
+    found = [[] for _ in AWARD_DESC_PATTERNS]
+    resume_at = [0] * len(AWARD_DESC_PATTERNS)
+    for m in AWARD_DESC_RE.finditer(description):
+        # The patterns start with different words, so only one can match at a position
+        k = (m.lastindex - 1) // 2
+        # findall never overlaps matches of the same pattern — resume after the last one
+        if m.start() < resume_at[k]:
+            continue
+        resume_at[k] = m.end(2 * k + 1)
+        found[k].append(m.group(2 * k + 2))
+    return [capture for captures in found for capture in captures]
 
 def matches_award(text: str) -> bool:
-    """Check if text contains award-related keywords."""
+    """Check if text contains award-related keywords (lowercases it itself)."""
     if not text:
         return False
-    lower = text.lower()
-    return any(keyword in lower for keyword in AWARD_KEYWORDS)
+    return AWARD_MATCHER.search(text.lower())
 
+# Pure, and the same few award strings come back from every project and source
+@lru_cache(maxsize=2048)
 def normalize_award_phrase(phrase: str) -> str:
     """Normalize award phrases to clean award names."""
     if not phrase:
         return None
     phrase = phrase.strip().lower()
-    phrase = re.sub(r"\s+", " ", phrase)
-    phrase = re.sub(r"['`]+", "", phrase)
-    phrase = re.sub(r"\b(winner of|award(ed)?|recipient of|at the|for|in|with)\b", "", phrase, flags=re.IGNORECASE).strip()
+    phrase = WS_RE.sub(" ", phrase)
+    phrase = QUOTE_RE.sub("", phrase)
+    phrase = FILLER_RE.sub("", phrase).strip()
     # Filter invalid awards
     if (len(phrase) < 5 or
-        re.search(r"\b(it|this|because|from|classification|usecases|trending|topics|way|team|presentation)\b", phrase) or
-        re.search(r"\d+", phrase) or
+        INVALID_RE.search(phrase) or
         len(phrase.split()) > 5):
         return None
-    # Match against AWARD_KEYWORDS
-    for keyword in AWARD_KEYWORDS:
-        if keyword in phrase or phrase in keyword:
-            return keyword
+    # Match against AWARD_KEYWORDS — a phrase of <= 5 words can hold at most one of them,
+    # so the automaton's hit is the same keyword the list scan would have returned
+    keyword = AWARD_MATCHER.find(phrase)
+    if keyword:
+        return keyword
+    pos = KEYWORD_BLOB.find(phrase)
+    if pos >= 0:
+        return AWARD_KEYWORDS[bisect_right(KEYWORD_STARTS, pos) - 1]
     return None
 
 def extract_awards(description: str, page_content: dict) -> list:
     """Extract normalized award phrases from description and other page elements."""
-    awards = []
+    awards = set()
     unmatched = []
 
     # Extract from JSON awards (if any)
     json_awards = page_content.get("awards", [])
     for award in json_awards:
         norm_award = normalize_award_phrase(award)
-        if norm_award and norm_award not in awards:
-            awards.append(norm_award)
+        if norm_award:
+            awards.add(norm_award)
         elif award:
             unmatched.append(award)
 
     # Extract from description
     if description:
-        patterns = [
-            r"award[:\-]?\s*([A-Za-z\s\-]{5,40})(?=\s*(?:$|\n|\.|,|;))",
-            r"winner of\s*([A-Za-z\s\-]{5,40})(?=\s*(?:$|\n|\.|,|;))",
-            r"received\s*([A-Za-z\s\-]{5,40})(?=\s*(?:$|\n|\.|,|;))",
-            r"won\s*([A-Za-z\s\-]{5,40})(?=\s*(?:$|\n|\.|,|;))",
-            r"(?:best|most|top|outstanding|innovative|promising)\s+([A-Za-z\s\-]{5,40})(?=\s*(?:$|\n|\.|,|;))"
-        ]
-        for pattern in patterns:
-            matches = re.findall(pattern, description, re.IGNORECASE)
-            for match in matches:
-                norm_award = normalize_award_phrase(match)
-                if norm_award and norm_award not in awards:
-                    awards.append(norm_award)
-                elif match:
-                    unmatched.append(match)
+        for match in find_description_awards(description):
+            norm_award = normalize_award_phrase(match)
+            if norm_award:
+                awards.add(norm_award)
+            elif match:
+                unmatched.append(match)
 
     # Extract from other page elements (e.g., badges, awards section)
-    for selector in ["div.awards", "span.badge", "div[class*='award']", "li[class*='award']"]:
+    for selector in AWARD_ELEMENT_SELECTORS:
         try:
             elements = page_content.get("elements", {}).get(selector, [])
             for text in elements:
                 norm_award = normalize_award_phrase(text)
-                if norm_award and norm_award not in awards:
-                    awards.append(norm_award)
+                if norm_award:
+                    awards.add(norm_award)
                 elif text:
                     unmatched.append(text)
         except Exception:
@@ -103,9 +148,10 @@ def extract_awards(description: str, page_content: dict) -> list:
 
     # Log unmatched for debugging
     if unmatched:
-        print(f"Unmatched awards for {page_content.get('id', 'unknown')} at {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}: {unmatched}")
+        log.info("Unmatched awards for %s: %s", page_content.get("id", "unknown"), unmatched)
 
-    return list(set([a for a in awards if a]))
+    # Sorted, so the same project always yields the same list
+    return sorted(awards)
 
 def wipe_outputs():
     """Remove old JSON files before each run."""
@@ -115,7 +161,12 @@ def wipe_outputs():
 
 def save_json(data, filename):
     """Save data to JSON file."""
-    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+    if ORJSON_AVAILABLE:
+        # Same layout as json.dump(indent=2, ensure_ascii=False), written as UTF-8 bytes directly
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
     with open(filename, "w", encoding="utf-8") as f:
         json.dump(data, f, indent=2, ensure_ascii=False)
 
@@ -124,68 +175,26 @@ async def extract_project_data(page, url):
     try:
         project_id = url.rstrip("/").split("/")[-1]
 
-        # Username
-        username = None
+        # Client-rendered fields appear after domcontentloaded — wait for the title once
         try:
-            username = await page.locator("a[href*='/users/']").first.text_content(timeout=15000)
-        except Exception:
-            pass
-
-        # License
-        license_text = None
-        try:
-            license_text = await page.locator("text=License").first.text_content(timeout=15000)
-        except Exception:
-            pass
-
-        # Title
-        title = None
-        try:
-            title = await page.locator("h1").first.text_content(timeout=15000)
-        except Exception:
+            await page.wait_for_selector("h1", timeout=15000)
+        except PlaywrightTimeoutError:
             pass
 
-        # Description
-        description = None
-        selectors = ["div.markdown", "div.prose", "article", "main"]
-        for sel in selectors:
-            try:
-                if await page.locator(sel).count() > 0:
-                    text = await page.locator(sel).inner_text(timeout=15000)
-                    if text and len(text.strip()) > 50:
-                        description = text.strip()
-                        break
-            except Exception:
-                continue
-
-        # Fallbacks
-        if not description:
-            try:
-                paragraphs = await page.locator("p").all_inner_texts()
-                text = "\n\n".join(p.strip() for p in paragraphs if p.strip())
-                if text and len(text) > 50:
-                    description = text
-            except Exception:
-                pass
-
-        if not description:
-            try:
-                description = await page.locator("meta[name='description']").get_attribute("content", timeout=15000)
-            except Exception:
-                pass
+        # Every field in one in-page call instead of a round trip per locator
+        fields = await page.evaluate(EXTRACT_FIELDS_JS, {
+            "descriptionSelectors": DESCRIPTION_SELECTORS,
+            "awardSelectors": AWARD_ELEMENT_SELECTORS,
+        })
+        username = fields["username"]
+        license_text = fields["license"]
+        title = fields["title"]
+        description = fields["description"]
+        elements = fields["elements"]
 
         if not description:
             description = "No description found"
 
-        # Extract additional elements for awards
-        elements = {}
-        for selector in ["div.awards", "span.badge", "div[class*='award']", "li[class*='award']"]:
-            try:
-                texts = await page.locator(selector).all_inner_texts()
-                elements[selector] = [t.strip() for t in texts if t.strip()]
-            except Exception:
-                elements[selector] = []
-
         page_content = {
             "id": project_id,
             "username": username,
@@ -203,7 +212,7 @@ async def extract_project_data(page, url):
         return page_content
 
     except Exception as e:
-        print(f"Error extracting {url} at {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}: {e}")
+        log.warning("Error extracting %s: %s", url, e)
         return {
             "id": url.split("/")[-1],
             "username": None,
@@ -214,128 +223,131 @@ async def extract_project_data(page, url):
             "elements": {}
         }
 
-async def scrape_all():
-    """Scrape all ReadyTensor publications."""
+async def collect_index_links(page, page_url):
+    """Project URLs linked from one index page; None if the page or its links never loaded."""
+    try:
+        await page.goto(page_url, wait_until="domcontentloaded", timeout=60000)
+        await page.wait_for_selector("a[href*='/publications/']", timeout=30000)
+    except Exception as e:
+        log.warning("⚠️ Failed to load %s: %s", page_url, e)
+        return None
+    # The list renders progressively — give it a moment to settle instead of a fixed sleep
+    try:
+        await page.wait_for_load_state("networkidle", timeout=10000)
+    except PlaywrightTimeoutError:
+        pass
+
+    # Every href in one browser call instead of a get_attribute round trip per link
+    hrefs = await page.eval_on_selector_all(
+        "a[href*='/publications/']", "els => els.map(e => e.getAttribute('href'))"
+    )
+    return {
+        "https://app.readytensor.ai" + href
+        for href in hrefs
+        if href and href.startswith("/publications/") and href != "/publications/create" and "page=" not in href
+    }
+
+async def scrape_project(page, url):
+    """Load a project page (transient failures retried) and extract its data."""
+    failure = await goto_with_retries(page, url, wait_until="domcontentloaded", timeout=60000)
+    if failure is None:
+        return await extract_project_data(page, url)
+    log.warning("⚠️ %s: %s", url, failure)
+    return {
+        "id": url.split("/")[-1],
+        "username": None,
+        "license": None,
+        "title": None,
+        "publication_description": failure,
+        "awards": [],
+        "elements": {}
+    }
+
+async def scrape_all(force=False):
+    """Scrape all ReadyTensor publications; with `force`, ignore the per-URL cache."""
     wipe_outputs()
+    cache = ProjectCache()
+    if force:
+        cache.clear()
     all_records = []
     award_records = []
 
     async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        context = await browser.new_context(
+        # Shared on-disk profile: scripts and chunks stay in Chromium's cache between runs
+        context = await launch_browser(
+            p,
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36",
             viewport={"width": 1280, "height": 720}
         )
-        page = await context.new_page()
-
-        print(f"🌍 Navigating to publications index at {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}...")
-        try:
-            await page.goto("https://app.readytensor.ai/publications", wait_until="domcontentloaded", timeout=60000)
-        except PlaywrightTimeoutError:
-            print(f"⚠️ Timeout on index page at {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}, continuing with collected URLs...")
+        # Images, fonts, media and analytics are never read. Stylesheets still load, since
+        # descriptions come from innerText, which depends on the page's CSS
+        await block_heavy_resources(context, keep_css=True)
+        # Index pages are independent (?page=N), so they load in parallel and the
+        # "stop after empty pages" rule is applied afterwards, in page order
+        page_urls = [INDEX_URL] + [f"{INDEX_URL}?page={n}" for n in range(2, MAX_PAGES + 1)]
+        log.info("🌍 Loading %d index pages...", len(page_urls))
+        index_links = await scrape_all_urls(
+            context, page_urls, collect_index_links, concurrency=MAX_PARALLEL_INDEX, block_resources=False
+        )
 
-        # Pagination loop
         urls = set()
-        page_num = 1
-        MAX_PAGES = 10  # Expect ~120 projects, 20 per page
+        pages_used = 0
         no_content_count = 0
-        MAX_NO_CONTENT = 2  # Stop after 2 pages with no project links
-
-        while page_num <= MAX_PAGES:
-            # Navigate to page using URL
-            page_url = f"https://app.readytensor.ai/publications?page={page_num}" if page_num > 1 else "https://app.readytensor.ai/publications"
-            print(f"📄 Navigating to page {page_num} ({page_url}) at {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}...", flush=True)
-
-            try:
-                await page.goto(page_url, wait_until="domcontentloaded", timeout=60000)
-                await page.wait_for_load_state("domcontentloaded", timeout=60000)
-                await asyncio.sleep(6)  # Increased wait for dynamic content
-            except Exception as e:
-                print(f"⚠️ Failed to load {page_url} at {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}: {e}")
-                no_content_count += 1
-                if no_content_count >= MAX_NO_CONTENT:
-                    print(f"✅ No content loaded for {MAX_NO_CONTENT} consecutive pages at {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}, stopping pagination.", flush=True)
-                    break
-                page_num += 1
-                continue
-
-            # Check for project links
-            try:
-                await page.wait_for_selector("a[href*='/publications/']", timeout=30000)
-                links = await page.locator("a[href*='/publications/']").all()
-                new_urls = set()
-                for link in links:
-                    href = await link.get_attribute("href")
-                    if href and href.startswith("/publications/") and href != "/publications/create" and not "page=" in href:
-                        full_url = "https://app.readytensor.ai" + href
-                        new_urls.add(full_url)
-
-                print(f"→ Found {len(new_urls)} new links on page {page_num} (total unique: {len(urls) + len(new_urls)}) at {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}", flush=True)
-                if new_urls:
-                    print(f"→ URLs on page {page_num}: {list(new_urls)[:5]}... (showing first 5)", flush=True)
-                else:
-                    print(f"→ No project links found on page {page_num} at {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}", flush=True)
-
-                # Update URLs
+        for page_num, new_urls in enumerate(index_links, start=1):
+            pages_used = page_num
+            if new_urls:
                 urls.update(new_urls)
-
-                # Stop if no project links found
-                if not new_urls:
-                    no_content_count += 1
-                    if no_content_count >= MAX_NO_CONTENT:
-                        print(f"✅ No project links found for {MAX_NO_CONTENT} consecutive pages at {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}, stopping pagination.", flush=True)
-                        break
-                else:
-                    no_content_count = 0
-
-            except PlaywrightTimeoutError:
-                print(f"⚠️ No project links found on page {page_num} at {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}", flush=True)
-                no_content_count += 1
-                if no_content_count >= MAX_NO_CONTENT:
-                    print(f"✅ No project links found for {MAX_NO_CONTENT} consecutive pages at {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}, stopping pagination.", flush=True)
-                    break
-
-            page_num += 1
+                log.info("→ Found %d new links on page %d (total unique: %d)", len(new_urls), page_num, len(urls))
+                no_content_count = 0
+                continue
+            log.info("→ No project links found on page %d", page_num)
+            no_content_count += 1
+            if no_content_count >= MAX_NO_CONTENT:
+                log.info("✅ No project links found for %d consecutive pages, stopping pagination.", MAX_NO_CONTENT)
+                break
 
         urls = sorted(list(urls))
-        print(f"🔗 Found {len(urls)} unique project URLs across {page_num - 1} pages at {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}", flush=True)
-        print(f"🔗 All URLs: {urls[:10]}... (showing first 10)", flush=True)
+        log.info("🔗 Found %d unique project URLs across %d pages", len(urls), pages_used)
+        log.info("🔗 All URLs: %s... (showing first 10)", urls[:10])
+
+        # Only projects not scraped within the cache TTL are opened again
+        records = {url: cache.get(url) for url in urls}
+        missing = [url for url, data in records.items() if data is None]
+        log.info("🗃️ %d projects from cache, %d to scrape", len(urls) - len(missing), len(missing))
+
+        # Scrape project details — several pages in flight at once, all in the one context
+        # (which already blocks resources for every page)
+        scraped = await scrape_all_urls(context, missing, scrape_project, block_resources=False)
+        records.update(zip(missing, scraped))
+        # On the event loop's thread: the sqlite connection can't be used from another one,
+        # and one small transaction doesn't need offloading
+        cache.put_many(
+            (url, data) for url, data in zip(missing, scraped)
+            if data and not data["publication_description"].startswith(FAILED_DESCRIPTIONS)
+        )
 
-        # Scrape project details
         for url in urls:
-            print(f"➡️ Scraping {url} at {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}", flush=True)
-            retries = 3
-            data = None
-            for attempt in range(1, retries + 1):
-                try:
-                    await page.goto(url, wait_until="domcontentloaded", timeout=60000)
-                    data = await extract_project_data(page, url)
-                    break
-                except Exception as e:
-                    print(f"⚠️ Attempt {attempt}/{retries} failed for {url} at {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}: {e}")
-                    if attempt == retries:
-                        data = {
-                            "id": url.split("/")[-1],
-                            "username": None,
-                            "license": None,
-                            "title": None,
-                            "publication_description": f"Failed after {retries} retries",
-                            "awards": [],
-                            "elements": {}
-                        }
+            data = records[url]
             if data:
                 all_records.append(data)
-                if data["awards"] or matches_award(data["publication_description"].lower()):
+                if data["awards"] or matches_award(data["publication_description"]):
                     award_records.append(data)
 
         await context.close()
-        await browser.close()
+    cache.close()
 
-    save_json(all_records, OUTPUT_ALL)
-    save_json(award_records, OUTPUT_AWARDS)
+    # Serializing the full dataset runs off the event loop
+    await asyncio.to_thread(save_json, all_records, OUTPUT_ALL)
+    await asyncio.to_thread(save_json, award_records, OUTPUT_AWARDS)
 
-    print(f"💾 Saved {len(all_records)} total projects to {OUTPUT_ALL} at {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}")
-    print(f"🏆 Saved {len(award_records)} award-tagged projects to {OUTPUT_AWARDS} at {datetime.now().strftime('%Y-%m-%d %H:%M:%S %Z')}")
+    log.info("💾 Saved %d total projects to %s", len(all_records), OUTPUT_ALL)
+    log.info("🏆 Saved %d award-tagged projects to %s", len(award_records), OUTPUT_AWARDS)
 
 if __name__ == "__main__":
-    asyncio.run(scrape_all())
\ No newline at end of file
+    # Timestamps come from the log format instead of a strftime in every message
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s",
+                        datefmt="%Y-%m-%d %H:%M:%S")
+    parser = argparse.ArgumentParser(description="Scrape ReadyTensor publications into data/")
+    parser.add_argument("--force", action="store_true", help="re-scrape every project, ignoring the cache")
+    args = parser.parse_args()
+    asyncio.run(scrape_all(force=args.force))
\ No newline at end of file
@@ -0,0 +1,50 @@
+# seen_index.py — persisted set of already-scraped URLs so repeat runs only fetch new pages
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+SEEN_DB = "./.cache/seen.sqlite3"
+# Records with these statuses are final; failures stay out of the index and are retried next run
+DONE_STATUSES = ("ok", "skipped")
+
+
+class SeenIndex:
+    """URL index scoped per output file — a URL scraped into one file is still new for another.
+
+    With ``force`` every URL is treated as new (successful results are still recorded).
+    """
+
+    def __init__(self, scope: str, db_path: str = SEEN_DB, force: bool = False):
+        self.scope = scope
+        self.force = force
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(db_path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS seen "
+            "(scope TEXT, url TEXT, scraped_at TEXT, status TEXT, PRIMARY KEY (scope, url))"
+        )
+
+    def is_scraped(self, url: str) -> bool:
+        if self.force:
+            return False
+        row = self._db.execute(
+            "SELECT 1 FROM seen WHERE scope = ? AND url = ?", (self.scope, url)
+        ).fetchone()
+        return row is not None
+
+    def filter_new(self, urls: Iterable[str]) -> List[str]:
+        return [url for url in urls if not self.is_scraped(url)]
+
+    def mark(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Record every finished record's URL — one transaction for the whole batch"""
+        now = datetime.utcnow().isoformat()
+        rows = [
+            (self.scope, r["url"], r.get("scraped_at") or now, r.get("status"))
+            for r in records if r.get("url") and r.get("status") in DONE_STATUSES
+        ]
+        with self._db:
+            self._db.executemany("INSERT OR REPLACE INTO seen VALUES (?, ?, ?, ?)", rows)
+
+    def close(self) -> None:
+        self._db.close()
@@ -0,0 +1,111 @@
+# semantic_cache.py — answer cache keyed on query embeddings (GPTCache-style)
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+class SemanticCache:
+    """LRU + TTL cache that serves a stored answer for near-duplicate questions.
+
+    Entries are only compared against others with the same award filter, and a
+    hit requires cosine similarity >= ``threshold`` (embeddings must be L2-normalised).
+    With ``db_path`` every stored answer is also written to SQLite, and the most recent
+    unexpired rows are loaded back on start so hits survive restarts and new sessions.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 600.0, threshold: float = 0.95,
+                 db_path: Optional[str] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.threshold = threshold
+        # key -> (award, embedding, answer, timestamp)
+        self._entries: "OrderedDict[str, Tuple[str, np.ndarray, str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if db_path:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS semcache "
+                "(key TEXT PRIMARY KEY, award TEXT, emb BLOB, answer TEXT, ts REAL)"
+            )
+            self._load()
+
+    def _load(self) -> None:
+        cutoff = time.time() - self.ttl
+        with self._db:
+            self._db.execute("DELETE FROM semcache WHERE ts < ?", (cutoff,))
+        rows = self._db.execute(
+            "SELECT key, award, emb, answer, ts FROM semcache ORDER BY ts DESC LIMIT ?",
+            (self.maxsize,)
+        ).fetchall()
+        # Oldest first, so the LRU order matches insertion time
+        for key, award, emb, answer, ts in reversed(rows):
+            self._entries[key] = (award, np.frombuffer(emb, dtype=np.float32), answer, ts)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expire(self, now: float) -> None:
+        expired = [k for k, (_, _, _, ts) in self._entries.items() if now - ts > self.ttl]
+        for key in expired:
+            del self._entries[key]
+
+    @staticmethod
+    def _key(query: str, award: str) -> str:
+        return f"{award}\x00{query.strip().lower()}"
+
+    def get(self, query: str, award: str = "") -> Optional[str]:
+        """Exact (query, award) hit — checked before embedding so repeats skip the model too"""
+        with self._lock:
+            entry = self._entries.get(self._key(query, award))
+            if entry is None or time.time() - entry[3] > self.ttl:
+                return None
+            self._entries.move_to_end(self._key(query, award))
+            return entry[2]
+
+    def lookup(self, embedding: np.ndarray, award: str = "") -> Optional[str]:
+        """Return the cached answer for the most similar query, or None on a miss"""
+        with self._lock:
+            self._expire(time.time())
+            keys = [k for k, entry in self._entries.items() if entry[0] == award]
+            if not keys:
+                return None
+
+            matrix = np.stack([self._entries[k][1] for k in keys])
+            scores = matrix @ embedding
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+
+            self._entries.move_to_end(keys[best])
+            return self._entries[keys[best]][2]
+
+    def store(self, query: str, embedding: np.ndarray, award: str, answer: str) -> None:
+        with self._lock:
+            key = self._key(query, award)
+            emb = np.asarray(embedding, dtype=np.float32)
+            ts = time.time()
+            self._entries.pop(key, None)
+            self._entries[key] = (award, emb, answer, ts)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+            if self._db is not None:
+                with self._db:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO semcache VALUES (?, ?, ?, ?, ?)",
+                        (key, award, emb.tobytes(), answer, ts)
+                    )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                with self._db:
+                    self._db.execute("DELETE FROM semcache")
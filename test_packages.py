@@ -1,9 +1,11 @@
 # test_packages.py
+import importlib.util
+
 packages = ["openai", "langchain", "chromadb", "sentence_transformers"]
 
+# find_spec only locates the package on the import path — nothing is imported or initialised
 for pkg in packages:
-    try:
-        __import__(pkg)
-        print(f"✅ {pkg} is installed correctly")
-    except ImportError as e:
-        print(f"❌ {pkg} is MISSING: {e}")
+    if importlib.util.find_spec(pkg) is not None:
+        print(f"✅ {pkg} is installed")
+    else:
+        print(f"❌ {pkg} is MISSING")
\ No newline at end of file
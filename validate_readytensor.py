@@ -4,39 +4,44 @@ import sys
 import re
 import pathlib
 
+LICENSE_RE = re.compile(r"license", re.IGNORECASE)
+
 def check_repo():
     root = pathlib.Path(".")
     issues = []
+    # One directory read instead of a stat per candidate file
+    entries = {entry.name for entry in os.scandir(root)}
 
     # 1. README.md exists
     readme_path = root / "README.md"
-    if not readme_path.exists():
+    if readme_path.name not in entries:
         issues.append("README.md missing")
     else:
         # Check for license mention
         try:
-            content = readme_path.read_text(encoding="utf-8", errors="ignore")
-            if not re.search(r"license", content, re.IGNORECASE):
-                issues.append("License not mentioned in README.md")
+            # Line by line, stopping at the first mention — the README is never held in memory whole
+            with readme_path.open("r", encoding="utf-8", errors="ignore") as f:
+                if not any(LICENSE_RE.search(line) for line in f):
+                    issues.append("License not mentioned in README.md")
         except Exception as e:
             issues.append(f"Could not read README.md: {e}")
 
     # 2. Environment file
     env_files = ["requirements.txt", "environment.yml", "pyproject.toml"]
-    if not any((root / f).exists() for f in env_files):
+    if not any(f in entries for f in env_files):
         issues.append("No environment file (requirements.txt, environment.yml, or pyproject.toml)")
 
     # 3. .gitignore
-    if not (root / ".gitignore").exists():
+    if ".gitignore" not in entries:
         issues.append(".gitignore missing")
 
     # 4. docs/ folder (recommended)
-    if not (root / "docs").exists() and not (root / "doc").exists():
+    if "docs" not in entries and "doc" not in entries:
         issues.append("docs/ folder missing (recommended for documentation)")
 
     # 5. Optional: Check for a license file
     license_files = ["LICENSE", "LICENSE.txt", "LICENSE.md"]
-    if not any((root / f).exists() for f in license_files):
+    if not any(f in entries for f in license_files):
         issues.append("No LICENSE file found (recommended)")
 
     return issues
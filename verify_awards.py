@@ -1,6 +1,6 @@
-import json
+from ndjson_store import loads
 
-with open('data/readytensor_awards.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
+with open('data/readytensor_awards.json', 'rb') as f:
+    data = loads(f.read())
 print('Total award-tagged projects:', len(data))
 print('Awards:', [p['awards'] for p in data if p['awards']][:10])
\ No newline at end of file